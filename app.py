@@ -1,8 +1,7 @@
 # app.py - 파일 기반 역복호화 API 추가
-import os
-import json
 import time
-import asyncio
+import logging
+import traceback
 from datetime import datetime
 
 from flask import Flask, request, jsonify
@@ -11,15 +10,35 @@ from flask_cors import CORS
 # 필요한 pseudonymization 함수들만 import
 from pseudonymization import (
     get_manager, 
-    pseudonymize_text_with_fake,
-    get_data_pool_stats,
-    initialize_pools
+    get_data_pool_stats
 )
+from utils.logging import LogStore, dumps_json, setup_queue_logging
 print("Pseudonymization 모듈 로드 성공")
 
+# 패키지 로그는 큐를 거쳐 별도 스레드에서 출력 (상세 로그는 DEBUG 레벨에서만)
+setup_queue_logging()
+
 # 설정
 LOG_FILE = "pseudo-log.json"
 MAX_LOGS = 100
+SERVICE_VERSION = "4.1.0"
+
+# 로그에 기록하는 타입별 탐지 개수 순서 (output.detection_counts[i] = LOG_TYPE_ORDER[i] 개수)
+LOG_TYPE_ORDER = ("이름", "전화번호", "이메일", "주소", "나이")
+
+# 서비스 기능 목록 (요청마다 바뀌지 않으므로 한 번만 구성)
+SERVICE_FEATURES = {
+    "file_based_restore": True,
+    "real_names_mode": True,
+    "enhanced_filtering": True,
+    "email_detection": True,
+    "smart_address": True,
+    "ner_model": "KPF/KPF-bert-ner",
+    "persistent_reverse_mapping": True
+}
+
+# 로그 저장소 (메모리에서 조회, 파일 기록은 백그라운드)
+log_store = LogStore(LOG_FILE, MAX_LOGS)
 
 # Flask 설정
 app = Flask(__name__)
@@ -28,41 +47,50 @@ CORS(app)
 # 전역 변수
 manager_initialized = False
 
-# 디버깅 헬퍼
+log = logging.getLogger(__name__)
+
+# 디버깅 헬퍼 (상세 로그는 DEBUG 레벨에서만 출력)
 def debug_log(message, data=None):
-    print(f"🔧 [SERVER-DEBUG] {message}")
-    if data:
-        print(f"   데이터: {data}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔧 [SERVER-DEBUG] %s", message)
+        if data:
+            log.debug("   데이터: %s", data)
 
 def debug_error(message, error=None):
-    print(f"❌ [SERVER-ERROR] {message}")
+    log.error("❌ [SERVER-ERROR] %s", message)
     if error:
-        print(f"   오류: {error}")
+        log.error("   오류: %s", error)
 
 # 로깅 유틸리티
-def load_logs():
-    try:
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"logs": []}
-    except Exception as e:
-        debug_error("로그 로드 실패", e)
-        return {"logs": []}
-
-def save_logs(logs_data):
-    try:
-        with open(LOG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(logs_data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        debug_error("로그 저장 실패", e)
+def load_logs(request_id=None):
+    # request_id 조회는 메모리에 없으면 파일까지 확인, 전체 조회는 다른 워커 프로세스의 로그도 반영
+    if request_id:
+        return log_store.lookup(request_id)
+    return log_store.snapshot(refresh=True)
 
 def add_log(entry):
-    logs_data = load_logs()
-    logs_data["logs"].append(entry)
-    if len(logs_data["logs"]) > MAX_LOGS:
-        logs_data["logs"] = logs_data["logs"][-MAX_LOGS:]
-    save_logs(logs_data)
+    log_store.add(entry)
+
+def ensure_manager():
+    """매니저 초기화 보장 후 반환 (실패 시 예외)"""
+    global manager_initialized
+    manager = get_manager()
+    if not manager.is_ready() and not manager.initialize():
+        raise RuntimeError("매니저가 준비되지 않았습니다")
+    if not manager_initialized:
+        manager_initialized = True
+        debug_log("매니저 초기화 완료")
+    return manager
+
+def count_by_type(items):
+    """탐지 항목의 타입별 개수 (LOG_TYPE_ORDER 순서의 목록)"""
+    counts = [0] * len(LOG_TYPE_ORDER)
+    for item in items:
+        try:
+            counts[LOG_TYPE_ORDER.index(item.get("type", ""))] += 1
+        except ValueError:
+            pass
+    return counts
 
 def build_reverse_map_from_detection(detection_items):
     """detection items에서 reverse_map 생성"""
@@ -85,17 +113,11 @@ def root():
         return response
     
     # 매니저 초기화
-    global manager_initialized
-    if not manager_initialized:
-        try:
-            debug_log("매니저 초기화 시작")
-            initialize_pools()
-            manager = get_manager()
-            manager_initialized = True
-            debug_log("매니저 초기화 완료")
-        except Exception as e:
-            debug_error("매니저 초기화 실패", e)
-            return jsonify({"error": f"매니저 초기화 실패: {e}"}), 500
+    try:
+        ensure_manager()
+    except Exception as e:
+        debug_error("매니저 초기화 실패", e)
+        return jsonify({"error": f"매니저 초기화 실패: {e}"}), 500
     
     try:
         stats = get_data_pool_stats()
@@ -106,18 +128,10 @@ def root():
     
     return jsonify({
         "service": "GenAI Pseudonymizer (파일 기반 역복호화)",
-        "version": "4.1.0",
+        "version": SERVICE_VERSION,
         "status": "running",
         "manager_ready": manager_initialized,
-        "features": {
-            "file_based_restore": True,
-            "real_names_mode": True,
-            "enhanced_filtering": True,
-            "email_detection": True,
-            "smart_address": True,
-            "ner_model": "KPF/KPF-bert-ner",
-            "persistent_reverse_mapping": True
-        },
+        "features": SERVICE_FEATURES,
         "stats": stats
     })
 
@@ -130,7 +144,7 @@ def pseudonymize():
         response.headers.add('Access-Control-Allow-Methods', '*')
         return response
     
-    request_start_time = time.time()
+    request_start_ns = time.perf_counter_ns()
     
     try:
         data = request.get_json()
@@ -143,31 +157,27 @@ def pseudonymize():
         text = data["prompt"]
         request_id = data.get("id", f"req_{int(time.time())}")
         
-        debug_log(f"⭐ 파일 기반 가명화 요청 시작 [{request_id}]", {
-            "prompt": text[:100] + "..." if len(text) > 100 else text,
-            "prompt_length": len(text),
-            "request_ip": request.remote_addr
-        })
+        if log.isEnabledFor(logging.DEBUG):
+            debug_log(f"⭐ 파일 기반 가명화 요청 시작 [{request_id}]", {
+                "prompt": text[:100] + "..." if len(text) > 100 else text,
+                "prompt_length": len(text),
+                "request_ip": request.remote_addr
+            })
         
-        start_time = time.time()
-        
-        if not manager_initialized:
-            try:
-                debug_log("매니저 즉시 초기화 시작")
-                initialize_pools()
-                manager = get_manager()
-                globals()["manager_initialized"] = True
-                debug_log("매니저 즉시 초기화 완료")
-            except Exception as e:
-                debug_error("매니저 초기화 실패", e)
-                response = jsonify({"error": f"매니저 초기화 실패: {e}"})
-                response.headers.add('Access-Control-Allow-Origin', '*')
-                return response, 500
+        start_ns = time.perf_counter_ns()
         
-        # 비동기 가명화 처리
-        debug_log(f"🚀 pseudonymize_text_with_fake 호출 시작 [{request_id}]")
-        result = asyncio.run(pseudonymize_text_with_fake(text))
-        debug_log(f"🚀 pseudonymize_text_with_fake 호출 완료 [{request_id}]")
+        try:
+            manager = ensure_manager()
+        except Exception as e:
+            debug_error("매니저 초기화 실패", e)
+            response = jsonify({"error": f"매니저 초기화 실패: {e}"})
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response, 500
+        
+        # 가명화 처리 (매니저 마이크로 배치 큐를 통해 실행)
+        debug_log(f"🚀 매니저 가명화 호출 시작 [{request_id}]")
+        result = manager.pseudonymize_queued(text)
+        debug_log(f"🚀 매니저 가명화 호출 완료 [{request_id}]")
         
         pseudonymized_text = result.get("pseudonymized_text", text)
         detected_items = result.get("detected_items", 0)
@@ -175,16 +185,17 @@ def pseudonymize():
         mapping = result.get("mapping", [])
         reverse_map = result.get("reverse_map", {})
         
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
-        debug_log(f"✅ 가명화 처리 완료 [{request_id}]", {
-            "original_text": text[:50] + "..." if len(text) > 50 else text,
-            "pseudonymized_text": pseudonymized_text[:50] + "..." if len(pseudonymized_text) > 50 else pseudonymized_text,
-            "detected_items": detected_items,
-            "reverse_map": reverse_map,
-            "reverse_map_size": len(reverse_map),
-            "processing_time": processing_time
-        })
+        if log.isEnabledFor(logging.DEBUG):
+            debug_log(f"✅ 가명화 처리 완료 [{request_id}]", {
+                "original_text": text[:50] + "..." if len(text) > 50 else text,
+                "pseudonymized_text": pseudonymized_text[:50] + "..." if len(pseudonymized_text) > 50 else pseudonymized_text,
+                "detected_items": detected_items,
+                "reverse_map": reverse_map,
+                "reverse_map_size": len(reverse_map),
+                "processing_time": processing_time
+            })
         
         # ⭐ 파일 기반 저장을 위한 로그 엔트리
         log_entry = {
@@ -198,7 +209,7 @@ def pseudonymize():
             },
             "output": {
                 "pseudonymized_text": pseudonymized_text,
-                "detection": detection_details,
+                "detection_counts": count_by_type(mapping),  # 탐지 상세는 아래 detection.items에만 기록
                 "processing_time": processing_time,
                 "reverse_map": reverse_map  # ⭐ reverse_map도 저장
             },
@@ -220,10 +231,9 @@ def pseudonymize():
             "success": True,
             "timestamp": datetime.now().isoformat(),
             "type": "pseudonymize",
-            "original_text": text,
             "detected_items": detected_items,
             "mode": "file_based_restore",
-            "total_processing_time": time.time() - request_start_time
+            "total_processing_time": (time.perf_counter_ns() - request_start_ns) * 1e-9
         }
         add_log(log_entry)
         
@@ -242,14 +252,21 @@ def pseudonymize():
             "detected_count": detected_items
         }
         
-        debug_log(f"📤 응답 전송 [{request_id}]", {
-            "response_size": len(json.dumps(response_data, ensure_ascii=False)),
-            "reverse_map_confirmed": bool(reverse_map),
-            "request_id_confirmed": bool(request_id),
-            "total_time": time.time() - request_start_time
-        })
+        raw = dumps_json(response_data, indent=False)
         
-        response = jsonify(response_data)
+        if log.isEnabledFor(logging.DEBUG):
+            debug_log(f"📤 응답 전송 [{request_id}]", {
+                "response_size": len(raw),
+                "reverse_map_confirmed": bool(reverse_map),
+                "request_id_confirmed": bool(request_id),
+                "total_time": (time.perf_counter_ns() - request_start_ns) * 1e-9
+            })
+        
+        response = app.response_class(
+            response=raw,
+            status=200,
+            mimetype="application/json; charset=utf-8"
+        )
         response.headers.add('Access-Control-Allow-Origin', '*')
         response.headers.add('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Requested-With')
@@ -258,7 +275,6 @@ def pseudonymize():
         
     except Exception as e:
         debug_error(f"가명화 처리 중 오류", e)
-        import traceback
         traceback.print_exc()
         
         response = jsonify({
@@ -291,7 +307,7 @@ def get_reverse_map():
         debug_log(f"🔍 reverse_map 조회 요청", {"request_id": request_id})
         
         # 로그 파일에서 해당 request_id 찾기
-        logs_data = load_logs()
+        logs_data = load_logs(request_id)
         logs = logs_data.get("logs", [])
         
         # 최근 로그부터 역순으로 검색
@@ -397,7 +413,7 @@ def restore_text():
             return response, 400
         
         # request_id로 reverse_map 찾기
-        logs_data = load_logs()
+        logs_data = load_logs(request_id)
         logs = logs_data.get("logs", [])
         reverse_map = {}
         
@@ -482,8 +498,7 @@ def restore_text():
 @app.route("/prompt_logs", methods=["GET"])
 def get_logs():
     try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            raw = f.read()
+        raw = dumps_json(load_logs())
         
         response = app.response_class(
             response=raw,
@@ -493,15 +508,6 @@ def get_logs():
         response.headers.add('Access-Control-Allow-Origin', '*')
         return response
         
-    except FileNotFoundError:
-        empty = {"logs": []}
-        response = app.response_class(
-            response=json.dumps(empty, ensure_ascii=False),
-            status=200,
-            mimetype="application/json; charset=utf-8"
-        )
-        response.headers.add('Access-Control-Allow-Origin', '*')
-        return response
     except Exception as e:
         debug_error("로그 읽기 오류", e)
         response = jsonify({"error": f"로그 읽기 오류: {e}"})
@@ -511,8 +517,7 @@ def get_logs():
 @app.route("/prompt_logs", methods=["DELETE"])
 def clear_logs():
     try:
-        with open(LOG_FILE, "w", encoding="utf-8") as f:
-            json.dump({"logs": []}, f, ensure_ascii=False)
+        log_store.clear()
         
         debug_log("로그 삭제 완료")
         response = jsonify({"success": True, "message": "로그가 삭제되었습니다"})
@@ -530,7 +535,7 @@ def health():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "manager_ready": manager_initialized,
-        "version": "4.1.0",
+        "version": SERVICE_VERSION,
         "file_based_restore": True,
         "persistent_reverse_mapping": True
     }
@@ -561,5 +566,4 @@ if __name__ == "__main__":
         print("🛑 서버 종료")
     except Exception as e:
         print(f"❌ 서버 시작 실패: {e}")
-        import traceback
         traceback.print_exc()
\ No newline at end of file
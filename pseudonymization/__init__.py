@@ -53,7 +53,10 @@ from .normalizers import (
 from .manager import (
     get_manager,
     is_manager_ready,
-    get_manager_status
+    get_manager_status,
+    preload_for_fork,
+    pseudonymize_with_manager,
+    pseudonymize_batch_with_manager
 )
 
 # 버전 정보 (업데이트)
@@ -99,6 +102,9 @@ __all__ = [
     'get_manager',
     'is_manager_ready',
     'get_manager_status',
+    'preload_for_fork',
+    'pseudonymize_with_manager',
+    'pseudonymize_batch_with_manager',
     
     # 메타데이터
     '__version__',
@@ -185,7 +191,42 @@ def test_enhanced_restoration():
     
     print("\n🧪 테스트 완료")
 
+def test_primary_detection():
+    """이메일/전화번호/나이 통합 탐지 테스트"""
+    print("\n🧪 이메일/전화번호/나이 탐지 테스트")
+    
+    test_cases = [
+        {
+            "name": "이메일에 붙은 전화번호",
+            "text": "01012345678a@b.com",
+            "expected": {"이메일": ["01012345678a@b.com"], "전화번호": ["010-1234-5678"]}
+        },
+        {
+            "name": "이메일 + 전화번호 + 나이",
+            "text": "연락처 010-1234-5678, 메일 kim25@test.com, 나이 25세",
+            "expected": {"이메일": ["kim25@test.com"], "전화번호": ["010-1234-5678"], "나이": ["25"]}
+        }
+    ]
+    
+    for i, test_case in enumerate(test_cases, 1):
+        print(f"\n테스트 {i}: {test_case['name']}")
+        print(f"  입력: {test_case['text']}")
+        
+        detected = {}
+        for item in detect_emails(test_case['text']) + detect_phones(test_case['text']) + detect_ages(test_case['text']):
+            detected.setdefault(item['type'], []).append(item['value'])
+        print(f"  탐지 결과: {detected}")
+        print(f"  예상 결과: {test_case['expected']}")
+        
+        if detected == test_case['expected']:
+            print(f"  ✅ 성공")
+        else:
+            print(f"  ❌ 실패")
+    
+    print("\n🧪 테스트 완료")
+
 # 모듈 로드 시 정보 출력 (선택적)
 if __name__ == "__main__":
     print_info()
-    test_enhanced_restoration()
\ No newline at end of file
+    test_enhanced_restoration()
+    test_primary_detection()
\ No newline at end of file
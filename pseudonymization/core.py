@@ -2,17 +2,39 @@
 import re
 import time
 import random
-import asyncio
-from typing import Dict, List, Any, Tuple
+import logging
+from typing import Dict, List, Any, Tuple, Optional
 
 # ⭐ relative import를 absolute import로 변경
 try:
-    from .normalizers import detect_pii_all
-    from .pools import get_pools, get_data_pool_stats
+    from .normalizers import detect_pii_all, run_sync
+    from .pools import get_pools, get_data_pool_stats, initialize_pools
 except ImportError:
     # 직접 실행 시 절대 import 사용
-    from pseudonymization.normalizers import detect_pii_all
-    from pseudonymization.pools import get_pools, get_data_pool_stats
+    from pseudonymization.normalizers import detect_pii_all, run_sync
+    from pseudonymization.pools import get_pools, get_data_pool_stats, initialize_pools
+
+log = logging.getLogger(__name__)
+
+def _build_replacement_pattern(keys) -> "re.Pattern":
+    """치환 대상 문자열들을 긴 것부터 나열한 정규식 (같은 위치에서 가장 긴 것이 매치)"""
+    ordered = sorted((key for key in keys if key), key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered)))
+
+def _replace_all_at_once(text: str, mapping: Dict[str, str]) -> Tuple[str, List[str]]:
+    """매핑의 모든 키를 한 번의 스캔으로 치환, (결과, 치환된 키 목록 - 처음 등장 순) 반환"""
+    if not text or not any(mapping):
+        return text, []
+    
+    replaced: Dict[str, None] = {}
+    
+    def substitute(match: "re.Match") -> str:
+        key = match.group(0)
+        replaced[key] = None
+        return mapping[key]
+    
+    result = _build_replacement_pattern(mapping).sub(substitute, text)
+    return result, list(replaced)
 
 def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[str, str], Dict[str, str]]:
     """강화된 가명 대체 맵 생성 (존칭 처리 개선)"""
@@ -20,7 +42,8 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
     substitution_map = {}
     reverse_map = {}
     
-    print(f"🔧 존칭 처리 개선된 대체 맵 생성 시작: {len(items)}개 항목")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔧 존칭 처리 개선된 대체 맵 생성 시작: %s개 항목", len(items))
     
     # 중복 제거
     seen_values = set()
@@ -31,9 +54,11 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
             unique_items.append(item)
             seen_values.add(key)
         else:
-            print(f"🔄 중복 제거: {item['type']} '{item['value']}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🔄 중복 제거: %s '%s'", item['type'], item['value'])
     
-    print(f"🧹 중복 제거 후: {len(unique_items)}개 항목")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🧹 중복 제거 후: %s개 항목", len(unique_items))
     
     # 타입별로 분류
     address_items = [item for item in unique_items if item["type"] == "주소"]
@@ -42,13 +67,15 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
     
     # ⭐ 1. 개선된 주소 처리 (각 부분을 개별 매핑)
     if address_items:
-        print(f"📍 주소 항목 {len(address_items)}개 개별 처리...")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📍 주소 항목 %s개 개별 처리...", len(address_items))
         
         for addr_item in address_items:
             original = addr_item["value"]
             
             if original in substitution_map:
-                print(f"🔄 이미 처리된 주소: '{original}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("🔄 이미 처리된 주소: '%s'", original)
                 continue
             
             fake_address = pools.get_fake_address()
@@ -58,17 +85,20 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
             substitution_map[original] = fake_address
             reverse_map[fake_address] = original
             
-            print(f"🏠 개별 주소 매핑: '{original}' → '{fake_address}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🏠 개별 주소 매핑: '%s' → '%s'", original, fake_address)
     
     # ⭐ 2. 존칭 처리 개선된 이름 처리
     if name_items:
-        print(f"👤 이름 항목 {len(name_items)}개 존칭 처리 개선...")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("👤 이름 항목 %s개 존칭 처리 개선...", len(name_items))
         
         for name_item in name_items:
             full_name = name_item["value"]  # 예: "이영희님"
             
             if full_name in substitution_map:
-                print(f"🔄 이미 처리된 이름: '{full_name}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("🔄 이미 처리된 이름: '%s'", full_name)
                 continue
             
             # ⭐ 존칭 분리
@@ -82,7 +112,8 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
                 base_name = full_name[:-1] 
                 honorific = '씨'
             
-            print(f"👤 이름 분석: '{full_name}' = '{base_name}' + '{honorific}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("👤 이름 분석: '%s' = '%s' + '%s'", full_name, base_name, honorific)
             
             # 기본 이름에 대한 가명 생성
             fake_base_name = pools.get_fake_name()
@@ -95,16 +126,19 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
                 fake_full_name = fake_base_name + honorific
                 substitution_map[full_name] = fake_full_name
                 reverse_map[fake_full_name] = full_name
-                print(f"👤 존칭 포함 매핑: '{full_name}' → '{fake_full_name}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("👤 존칭 포함 매핑: '%s' → '%s'", full_name, fake_full_name)
             
-            print(f"👤 기본 이름 매핑: '{base_name}' → '{fake_base_name}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("👤 기본 이름 매핑: '%s' → '%s'", base_name, fake_base_name)
     
     # ⭐ 3. 기타 항목들 처리
     for item in other_items:
         original = item["value"]
         
         if original in substitution_map:
-            print(f"🔄 이미 처리됨: {item['type']} '{original}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🔄 이미 처리됨: %s '%s'", item['type'], original)
             continue
         
         fake_value = None
@@ -116,7 +150,8 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
                 max_age = min(80, age + 5)
                 fake_value = str(random.randint(min_age, max_age))
             except (ValueError, TypeError):
-                print(f"❌ 나이 치환 실패 (원본 유지): '{original}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("❌ 나이 치환 실패 (원본 유지): '%s'", original)
                 continue
                 
         elif item["type"] == "이메일":
@@ -128,86 +163,89 @@ def create_enhanced_substitution_map(items: List[Dict[str, Any]]) -> Tuple[Dict[
         if fake_value and fake_value != original:
             substitution_map[original] = fake_value
             reverse_map[fake_value] = original
-            print(f"🔄 {item['type']} 매핑: '{original}' → '{fake_value}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🔄 %s 매핑: '%s' → '%s'", item['type'], original, fake_value)
     
-    print(f"✅ 존칭 처리 개선된 대체 맵 생성 완료:")
-    print(f"  - substitution_map: {len(substitution_map)}개")
-    print(f"  - reverse_map: {len(reverse_map)}개")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("✅ 존칭 처리 개선된 대체 맵 생성 완료:")
+        log.debug("  - substitution_map: %s개", len(substitution_map))
+        log.debug("  - reverse_map: %s개", len(reverse_map))
     
-    print(f"📤 최종 복원 매핑 (검증):")
-    for fake, original in reverse_map.items():
-        print(f"  '{fake}' → '{original}'")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("📤 최종 복원 매핑 (검증):")
+        for fake, original in reverse_map.items():
+            log.debug("  '%s' → '%s'", fake, original)
     
     return substitution_map, reverse_map
 
 def apply_enhanced_substitutions(text: str, substitution_map: Dict[str, str]) -> str:
     """강화된 대체 적용 (긴 문자열 우선)"""
-    result = text
-    
-    print(f"🔄 강화된 치환 시작: '{text}'")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔄 강화된 치환 시작: '%s'", text)
     
-    # ⭐ 길이 순으로 정렬 (긴 것부터 먼저 치환)
-    sorted_items = sorted(substitution_map.items(), key=lambda x: len(x[0]), reverse=True)
+    # ⭐ 한 번의 스캔으로 치환 (같은 위치에서는 긴 것 우선, 치환 결과는 다시 치환하지 않음)
+    result, replaced = _replace_all_at_once(text, substitution_map)
     
-    substitution_count = 0
-    
-    for original, replacement in sorted_items:
-        if original in result:
-            old_result = result
-            result = result.replace(original, replacement)
-            
-            if old_result != result:
-                substitution_count += 1
-                print(f"🔄 치환 완료: '{original}' → '{replacement}'")
-    
-    print(f"✅ 치환 완료: {substitution_count}개 항목 치환됨")
-    print(f"📝 최종 결과: '{result}'")
+    if log.isEnabledFor(logging.DEBUG):
+        for original in replaced:
+            log.debug("🔄 치환 완료: '%s' → '%s'", original, substitution_map[original])
+        log.debug("✅ 치환 완료: %s개 항목 치환됨", len(replaced))
+        log.debug("📝 최종 결과: '%s'", result)
     return result
 
-async def pseudonymize_text_with_fake(text: str) -> Dict[str, Any]:
-    """실제 가명을 사용한 가명화 (존칭 처리 개선)"""
-    start_time = time.time()
+async def pseudonymize_text_with_fake(text: str, ner_entities: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """실제 가명을 사용한 가명화 (존칭 처리 개선)
+
+    ner_entities: 일괄 처리에서 미리 추출한 NER 결과 (없으면 탐지 중 NER 실행)
+    """
+    start_ns = time.perf_counter_ns()  # 단조 시계 (정수 나노초)
     
-    print(f"\n=== 🔐 존칭 처리 개선된 가명화 시작 ===")
-    print(f"📝 원본 텍스트: '{text}'")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("=== 🔐 존칭 처리 개선된 가명화 시작 ===")
+        log.debug("📝 원본 텍스트: '%s'", text)
     
     # 1. PII 탐지
-    detection_start = time.time()
-    items = await detect_pii_all(text)
-    detection_time = time.time() - detection_start
+    detection_start_ns = time.perf_counter_ns()
+    items = await detect_pii_all(text, ner_entities)
+    detection_time = (time.perf_counter_ns() - detection_start_ns) * 1e-9
     
-    print(f"🔍 탐지 완료: {len(items)}개 항목 ({detection_time:.3f}초)")
-    for i, item in enumerate(items):
-        start_pos = item.get('start', 'N/A')
-        end_pos = item.get('end', 'N/A')
-        print(f"  {i+1}. {item['type']}: '{item['value']}' (출처: {item['source']}, 위치: {start_pos}-{end_pos})")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔍 탐지 완료: %s개 항목 (%.3f초)", len(items), detection_time)
+        for i, item in enumerate(items):
+            start_pos = item.get('start', 'N/A')
+            end_pos = item.get('end', 'N/A')
+            log.debug("  %s. %s: '%s' (출처: %s, 위치: %s-%s)", i+1, item['type'], item['value'], item['source'], start_pos, end_pos)
     
     # 2. 존칭 처리 개선된 대체 맵 생성
-    substitution_start = time.time()
+    substitution_start_ns = time.perf_counter_ns()
     substitution_map, reverse_map = create_enhanced_substitution_map(items)
     
     # 3. 가명화 적용
     pseudonymized_text = apply_enhanced_substitutions(text, substitution_map)
-    substitution_time = time.time() - substitution_start
+    substitution_time = (time.perf_counter_ns() - substitution_start_ns) * 1e-9
     
     # 4. reverse_map 검증
-    print(f"🔍 reverse_map 최종 검증:")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔍 reverse_map 최종 검증:")
     validated_reverse_map = {}
     for fake, original in reverse_map.items():
         if fake in pseudonymized_text:
             validated_reverse_map[fake] = original
-            print(f"  ✅ 유효한 매핑: '{fake}' → '{original}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("  ✅ 유효한 매핑: '%s' → '%s'", fake, original)
         else:
-            print(f"  ⚠️ 미사용 매핑 (제외): '{fake}' → '{original}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("  ⚠️ 미사용 매핑 (제외): '%s' → '%s'", fake, original)
     
-    total_time = time.time() - start_time
+    total_time = (time.perf_counter_ns() - start_ns) * 1e-9
     
-    print(f"📊 최종 결과:")
-    print(f"  📝 원본: '{text}'")
-    print(f"  🎭 가명화: '{pseudonymized_text}'")
-    print(f"  🔑 검증된 복원 맵: {validated_reverse_map}")
-    print(f"  ⏱️ 처리시간: {total_time:.3f}초")
-    print(f"=== 🔐 존칭 처리 개선된 가명화 완료 ===\n")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("📊 최종 결과:")
+        log.debug("  📝 원본: '%s'", text)
+        log.debug("  🎭 가명화: '%s'", pseudonymized_text)
+        log.debug("  🔑 검증된 복원 맵: %s", validated_reverse_map)
+        log.debug("  ⏱️ 처리시간: %.3f초", total_time)
+        log.debug("=== 🔐 존칭 처리 개선된 가명화 완료 ===")
     
     return {
         "pseudonymized_text": pseudonymized_text,
@@ -251,35 +289,26 @@ async def pseudonymize_text_with_fake(text: str) -> Dict[str, Any]:
 
 def pseudonymize_text(text: str) -> Dict[str, Any]:
     """표준 가명화 함수 (동기 버전)"""
-    return asyncio.run(pseudonymize_text_with_fake(text))
+    return run_sync(pseudonymize_text_with_fake(text))
 
 def restore_original_enhanced(pseudonymized_text: str, reverse_map: Dict[str, str]) -> str:
     """존칭 처리 개선된 원본 복원"""
-    print(f"🔄 존칭 처리 개선된 복원 시작:")
-    print(f"  📝 가명화 텍스트: '{pseudonymized_text}'")
-    print(f"  🔑 복원 맵: {reverse_map}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🔄 존칭 처리 개선된 복원 시작:")
+        log.debug("  📝 가명화 텍스트: '%s'", pseudonymized_text)
+        log.debug("  🔑 복원 맵: %s", reverse_map)
     
-    result = pseudonymized_text
-    
-    # ⭐ 길이 순으로 정렬 (긴 것부터 복원)
-    sorted_items = sorted(reverse_map.items(), key=lambda x: len(x[0]), reverse=True)
-    
-    replacement_count = 0
-    replacement_details = []
-    
-    for fake, original in sorted_items:
-        if fake in result:
-            old_result = result
-            result = result.replace(fake, original)
-            
-            if old_result != result:
-                replacement_count += 1
-                replacement_details.append({"fake": fake, "original": original})
-                print(f"  🔄 복원: '{fake}' → '{original}'")
+    # ⭐ 한 번의 스캔으로 복원 (같은 위치에서는 긴 것 우선, 복원 결과는 다시 치환하지 않음)
+    result, replaced = _replace_all_at_once(pseudonymized_text, reverse_map)
     
-    print(f"✅ 존칭 처리 개선된 복원 완료: {replacement_count}개 항목 복원")
-    print(f"  📝 복원된 텍스트: '{result}'")
-    print(f"  📊 복원 상세: {replacement_details}")
+    if log.isEnabledFor(logging.DEBUG):
+        replacement_details = []
+        for fake in replaced:
+            replacement_details.append({"fake": fake, "original": reverse_map[fake]})
+            log.debug("  🔄 복원: '%s' → '%s'", fake, reverse_map[fake])
+        log.debug("✅ 존칭 처리 개선된 복원 완료: %s개 항목 복원", len(replaced))
+        log.debug("  📝 복원된 텍스트: '%s'", result)
+        log.debug("  📊 복원 상세: %s", replacement_details)
     
     return result
 
@@ -292,10 +321,6 @@ def workflow_process_ai_response(ai_response: str, reverse_map: Dict[str, str])
 
 def load_data_pools():
     """데이터풀 로드"""
-    try:
-        from .pools import initialize_pools
-    except ImportError:
-        from pseudonymization.pools import initialize_pools
     initialize_pools()
     return get_data_pool_stats()
 
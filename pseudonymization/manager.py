@@ -1,51 +1,453 @@
 # pseudonymization/manager.py - 모듈화된 매니저
+import gc
+import copy
+import math
 import time
-from typing import Dict, Any, Optional
+import queue
+import hashlib
+import asyncio
+import logging
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from .core import pseudonymize_text_with_fake, get_data_pool_stats
 from .pools import initialize_pools, get_pools
+from .normalizers import warm_up_detectors, has_pii_candidate, run_sync
+
+log = logging.getLogger(__name__)
+
+# numpy (선택적 - 지연 시간 백분위 계산용)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# NER 일괄 추출 (선택적)
+try:
+    from .model import (
+        extract_entities_batch_with_ner, load_ner_model_async, preload_ner_model_for_fork,
+        is_ner_available, get_device_info, get_ner_cache_info
+    )
+    NER_AVAILABLE = True
+except ImportError:
+    NER_AVAILABLE = False
+
+# NER 파이프라인 한 번에 처리할 텍스트 수
+NER_BATCH_SIZE = 16
+
+# pseudonymize_many에서 동시에 처리할 배치 수
+MANY_MAX_CONCURRENCY = 4
+
+# 백분위 계산에 쓰는 최근 처리 시간 개수
+LATENCY_WINDOW = 4096
+
+# 지수 이동 평균 가중치 (새 값 비중 5% - 대략 최근 20~40개 요청을 반영)
+EMA_ALPHA = 0.05
+
+# 가명화 결과 캐시 최대 항목 수 (같은 텍스트 재요청 시 탐지 생략)
+RESULT_CACHE_SIZE = 4096
+RESULT_CACHE_MAX_TEXT_LENGTH = 16384  # 이보다 긴 텍스트는 캐시하지 않음 (메모리 보호)
+
+# 마이크로 배치 설정 (요청을 모아 한 번에 처리)
+MICRO_BATCH_MAX_SIZE = 16       # 한 번에 모을 최대 요청 수
+MICRO_BATCH_MAX_WAIT = 0.01     # 첫 요청 이후 추가 요청을 기다리는 최대 시간 (초, 정규식 탐지만)
+MICRO_BATCH_MAX_WAIT_NER = 0.03 # NER 모델 로드 시 대기 시간 (모델 호출 1회에 더 많은 요청을 모음)
+LENGTH_BUCKETS = (32, 128, 512)  # 길이 구간 경계 (비슷한 길이끼리 같은 배치)
+
+def _freeze(data: Any) -> Any:
+    """중첩 dict까지 읽기 전용 뷰(MappingProxyType)로 변환"""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    return data
+
+def _thaw(data: Any) -> Any:
+    """읽기 전용 뷰를 일반 dict로 복사 (JSON 직렬화/수정 가능)"""
+    if isinstance(data, (dict, MappingProxyType)):
+        return {key: _thaw(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_thaw(value) for value in data]
+    return data
+
+def _text_key(text: str, pool_version: int) -> Optional[Tuple[int, bytes]]:
+    """결과 캐시 키 (데이터풀 버전, blake2b 128비트 해시) - 캐시 대상이 아닌 텍스트는 None
+
+    긴 텍스트와 PII 후보 문자가 없는 텍스트는 캐시하지 않음 (후자는 탐지를 바로 건너뛰므로
+    다시 계산하는 편이 복사본을 꺼내는 것보다 싸고, 캐시 자리를 차지하지 않도록)
+    """
+    if len(text) > RESULT_CACHE_MAX_TEXT_LENGTH or not has_pii_candidate(text):
+        return None
+    return pool_version, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+class RunningStats:
+    """누적 평균/표준편차 (Welford 방식 - 값 목록을 저장하지 않음) + 최근 추세용 지수 이동 평균"""
+    
+    __slots__ = ("count", "mean", "m2", "ema")
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ema = 0.0
+    
+    def add(self, value: float):
+        """값 하나 반영"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        # 첫 값은 그대로, 이후는 (1 - α)·ema + α·value
+        self.ema = value if self.count == 1 else (1.0 - EMA_ALPHA) * self.ema + EMA_ALPHA * value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """통계 요약 반환"""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": math.sqrt(self.m2 / self.count) if self.count else 0.0,
+            "ema": self.ema
+        }
+
+class LatencyRing:
+    """최근 처리 시간 고정 크기 링 버퍼 (백분위 계산용, 구간 합계를 유지해 평균은 O(1))"""
+    
+    __slots__ = ("capacity", "values", "index", "size", "total")
+    
+    def __init__(self, capacity: int = LATENCY_WINDOW):
+        self.capacity = capacity
+        self.values = np.empty(capacity, dtype=np.float64) if NUMPY_AVAILABLE else [0.0] * capacity
+        self.index = 0
+        self.size = 0
+        self.total = 0.0
+    
+    def add(self, value: float):
+        """값 하나 기록 (가장 오래된 값을 덮어쓰고 합계에서 제외)"""
+        value = float(value)
+        if self.size == self.capacity:
+            self.total -= float(self.values[self.index])
+        else:
+            self.size += 1
+        self.values[self.index] = value
+        self.total += value
+        self.index = (self.index + 1) % self.capacity
+        if self.index == 0:
+            # 한 바퀴마다 다시 합산해 부동소수점 오차 누적 방지 (numpy는 C 루프 합산, 리스트는 fsum으로 정확히)
+            self.total = float(self.values.sum()) if NUMPY_AVAILABLE else math.fsum(self.values)
+    
+    def mean(self) -> float:
+        """최근 구간 평균"""
+        return self.total / self.size if self.size else 0.0
+    
+    def percentiles(self, quantiles=(0.5, 0.95, 0.99)) -> Dict[str, float]:
+        """백분위 반환 (예: {"p50": ..., "p95": ..., "p99": ...})"""
+        if not self.size:
+            return {f"p{round(q * 100)}": 0.0 for q in quantiles}
+        
+        ranks = [min(self.size - 1, int(q * self.size)) for q in quantiles]
+        if NUMPY_AVAILABLE:
+            window = np.partition(self.values[:self.size], ranks)
+        else:
+            window = sorted(self.values[:self.size])
+        return {f"p{round(q * 100)}": float(window[rank]) for q, rank in zip(quantiles, ranks)}
 
 class PseudonymizationManager:
     """가명화 매니저 클래스"""
     
+    # 인스턴스 __dict__ 없이 고정 속성만 사용 (요청마다 접근하는 속성 조회 비용 감소)
+    __slots__ = (
+        "initialized", "pools", "stats", "pools_initialized", "ner_model_loaded",
+        "timing_stats", "latency", "_stats_lock", "_result_cache", "_cache_lock",
+        "cache_hits", "cache_misses", "_flag_lock", "_request_queue", "_batch_worker",
+        "_monotonic_start", "_init_lock"
+    )
+    
     def __init__(self):
         self.initialized = False
         self.pools = None
-        self.stats = {}
+        self.stats: MappingProxyType = MappingProxyType({})  # 초기화 시점 데이터풀 통계 (읽기 전용)
+        self.pools_initialized = False
+        self.ner_model_loaded = False
+        # total/detection/substitution은 캐시 미스(실제 가명화)만, cache_hit은 캐시 적중 응답 시간
+        self.timing_stats = {
+            "total": RunningStats(),
+            "detection": RunningStats(),
+            "substitution": RunningStats(),
+            "cache_hit": RunningStats()
+        }
+        self.latency = LatencyRing()
+        self._stats_lock = threading.Lock()
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._flag_lock = threading.Lock()
+        self._request_queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._batch_worker: Optional[threading.Thread] = None
+        self._monotonic_start: Optional[float] = None  # 초기화 완료 시각 (가동 시간 계산용)
+        self._init_lock = threading.Lock()
         
     def initialize(self):
-        """매니저 초기화"""
+        """매니저 초기화 (이중 검사 - 초기화 이후에는 잠금 없이 바로 반환)"""
+        if self.initialized:
+            return True
+        with self._init_lock:
+            if self.initialized:
+                return True
+            return self._initialize_locked()
+    
+    def _initialize_locked(self):
+        """실제 초기화 (_init_lock 보유 상태에서 한 번만 실행)"""
         try:
-            print("가명화매니저 초기화 중...")
-            initialize_pools()
+            log.info("가명화매니저 초기화 중...")
+            
+            # ⭐ NER 모델은 백그라운드에서 로드 (초기화는 데이터풀만 기다림, NER 호출은 로드 완료까지 대기)
+            self._load_ner_model()
+            self._initialize_pools()
+            
+            if not self.pools_initialized:
+                raise RuntimeError("데이터풀 초기화 실패")
+            
             self.pools = get_pools()
-            self.stats = get_data_pool_stats()
+            self.stats = _freeze(get_data_pool_stats())
+            warm_up_detectors()  # 정규식/실명·주소 매처 캐시 미리 구성
             self.initialized = True
-            print("가명화매니저 초기화 완료")
+            self._monotonic_start = time.monotonic()
+            self._start_batch_worker()
+            log.info("가명화매니저 초기화 완료")
             return True
         except Exception as e:
-            print(f"매니저 초기화 실패: {e}")
+            log.error("매니저 초기화 실패: %s", e)
             return False
     
+    def _initialize_pools(self):
+        """데이터풀 초기화"""
+        try:
+            initialize_pools()
+            with self._flag_lock:
+                self.pools_initialized = True
+        except Exception as e:
+            log.error("데이터풀 초기화 실패: %s", e)
+    
+    def _load_ner_model(self):
+        """NER 모델 백그라운드 로드 시작 (완료되면 플래그 갱신, 실패해도 정규식 탐지는 가능)"""
+        if not NER_AVAILABLE or not is_ner_available():
+            return
+        load_ner_model_async().add_done_callback(self._on_ner_model_loaded)
+    
+    def _on_ner_model_loaded(self, future: Future):
+        """백그라운드 NER 로드 완료 콜백"""
+        try:
+            loaded = future.result()
+        except Exception as e:
+            log.warning("NER 모델 로드 실패: %s", e)
+            return
+        with self._flag_lock:
+            self.ner_model_loaded = loaded
+    
     def is_ready(self) -> bool:
         """매니저 준비 상태 확인"""
         return self.initialized and self.pools is not None
     
     def get_status(self) -> Dict[str, Any]:
-        """매니저 상태 반환"""
+        """매니저 상태 반환 (stats는 복사하지 않은 읽기 전용 뷰 - 직렬화가 필요하면 snapshot_stats() 사용)"""
         return {
             "initialized": self.initialized,
             "ready": self.is_ready(),
+            "pools_initialized": self.pools_initialized,
+            "ner_model_loaded": self.ner_model_loaded,
+            "device": get_device_info() if NER_AVAILABLE else {"device": "cpu", "ner_available": False},
+            "ner_cache": get_ner_cache_info() if NER_AVAILABLE and is_ner_available() else None,
             "stats": self.stats,
+            "uptime": self._format_uptime(),
             "timestamp": time.time()
         }
     
+    def snapshot_stats(self) -> Dict[str, Any]:
+        """초기화 시점 데이터풀 통계의 독립 복사본 (JSON 직렬화/수정 가능)"""
+        return _thaw(self.stats)
+    
+    def _format_uptime(self) -> Optional[str]:
+        """가동 시간 (H:MM:SS, 단조 시계 기준)"""
+        if self._monotonic_start is None:
+            return None
+        secs = int(time.monotonic() - self._monotonic_start)
+        return f"{secs // 3600:d}:{(secs // 60) % 60:02d}:{secs % 60:02d}"
+    
     async def pseudonymize(self, text: str) -> Dict[str, Any]:
-        """가명화 실행"""
+        """가명화 실행 (크기 1의 일괄 처리)"""
+        results = await self.pseudonymize_batch([text])
+        return results[0]
+    
+    async def pseudonymize_many(self, texts: List[str]) -> List[Union[Dict[str, Any], BaseException]]:
+        """여러 텍스트를 NER 배치 크기로 나눠 동시에 가명화 (동시 배치 수는 세마포어로 제한)
+
+        한 배치 안에서는 입력 순서대로 처리. 실패한 배치의 텍스트 자리에는 예외 객체를 반환.
+        """
+        semaphore = asyncio.Semaphore(MANY_MAX_CONCURRENCY)
+        chunks = [texts[i:i + NER_BATCH_SIZE] for i in range(0, len(texts), NER_BATCH_SIZE)]
+        
+        async def run_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.pseudonymize_batch(chunk)
+        
+        chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        
+        results: List[Union[Dict[str, Any], BaseException]] = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, BaseException):
+                results.extend([chunk_result] * len(chunk))
+            else:
+                results.extend(chunk_result)
+        return results
+    
+    async def pseudonymize_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """여러 텍스트 일괄 가명화 (NER은 배치로 한 번에 실행, 결과는 입력 순서)"""
+        if not self.is_ready():
+            raise RuntimeError("매니저가 초기화되지 않았습니다")
+        
+        if not texts:
+            return []
+        
+        # 캐시에 있는 텍스트는 저장된 결과 사용 (데이터풀이 다시 로드되면 이전 결과는 사용하지 않음)
+        pool_version = get_pools()._version
+        keys = [_text_key(text, pool_version) for text in texts]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        missing = []
+        lookup_start_ns = time.perf_counter_ns()
+        with self._cache_lock:
+            for index, key in enumerate(keys):
+                cached = self._result_cache.get(key) if key is not None else None
+                if cached is None:
+                    missing.append(index)
+                    continue
+                self._result_cache.move_to_end(key)
+                results[index] = copy.deepcopy(cached)
+            self.cache_hits += len(texts) - len(missing)
+            self.cache_misses += len(missing)
+        
+        # ⭐ 캐시 적중도 지연 시간 통계에 반영 (미스만 기록하면 적중률이 오를수록 지연 시간이 과대 표시됨)
+        hits = len(texts) - len(missing)
+        if hits:
+            self._record_cache_hits(hits, (time.perf_counter_ns() - lookup_start_ns) * 1e-9 / len(texts))
+        
+        if not missing:
+            return results
+        
+        # NER 일괄 추출 (모델 추론은 이벤트 루프 밖 스레드에서, PII 후보 문자가 없는 텍스트는 제외)
+        missing_texts = [texts[index] for index in missing]
+        ner_results: List[Optional[List[Dict[str, Any]]]] = [None] * len(missing_texts)
+        ner_positions = [pos for pos, text in enumerate(missing_texts) if has_pii_candidate(text)]
+        if NER_AVAILABLE and ner_positions and is_ner_available():
+            entities = await asyncio.to_thread(
+                extract_entities_batch_with_ner, [missing_texts[pos] for pos in ner_positions], NER_BATCH_SIZE
+            )
+            for pos, ner_entities in zip(ner_positions, entities):
+                ner_results[pos] = ner_entities
+        
+        # 가명 발급 순서가 입력 순서와 같도록 텍스트별로 차례대로 처리
+        for index, text, ner_entities in zip(missing, missing_texts, ner_results):
+            result = await pseudonymize_text_with_fake(text, ner_entities)
+            self._record_timings(result.get("timings", {}))
+            self._store_result(keys[index], result)
+            results[index] = result
+        return results
+    
+    def _store_result(self, key: Optional[Tuple[int, bytes]], result: Dict[str, Any]):
+        """가명화 결과를 캐시에 저장 (호출자가 결과를 수정해도 영향 없도록 복사본 저장)"""
+        if key is None:
+            return
+        snapshot = copy.deepcopy(result)
+        with self._cache_lock:
+            self._result_cache[key] = snapshot
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _record_timings(self, timings: Dict[str, float]):
+        """요청별 처리 시간을 누적 통계에 반영"""
+        with self._stats_lock:
+            for key, stats in self.timing_stats.items():
+                if key in timings:
+                    stats.add(timings[key])
+            if "total" in timings:
+                self.latency.add(timings["total"])
+    
+    def _record_cache_hits(self, count: int, seconds_each: float):
+        """캐시 적중 응답 시간을 cache_hit 통계와 최근 지연 시간 구간에 반영"""
+        with self._stats_lock:
+            stats = self.timing_stats["cache_hit"]
+            for _ in range(count):
+                stats.add(seconds_each)
+                self.latency.add(seconds_each)
+    
+    def submit(self, text: str) -> Future:
+        """가명화 요청을 마이크로 배치 큐에 넣고 Future 반환"""
         if not self.is_ready():
             raise RuntimeError("매니저가 초기화되지 않았습니다")
         
-        return await pseudonymize_text_with_fake(text)
+        future: Future = Future()
+        self._request_queue.put((text, future))
+        return future
+    
+    def pseudonymize_queued(self, text: str) -> Dict[str, Any]:
+        """마이크로 배치 큐를 통한 가명화 (동기, 결과가 나올 때까지 대기)"""
+        return self.submit(text).result()
+    
+    def _start_batch_worker(self):
+        """마이크로 배치 워커 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._batch_worker is not None and self._batch_worker.is_alive():
+            return
+        self._batch_worker = threading.Thread(
+            target=self._batch_worker_loop, name="pseudonymization-batcher", daemon=True
+        )
+        self._batch_worker.start()
+    
+    def _batch_worker_loop(self):
+        """큐에서 요청을 모아 길이 구간별로 일괄 처리"""
+        previous_size = 0
+        while True:
+            requests = [self._request_queue.get()]
+            
+            # ⭐ 직전 배치가 단건이고 대기 중인 요청도 없으면 (동시 요청 없음) 기다리지 않고 바로 처리
+            if previous_size > 1 or not self._request_queue.empty():
+                max_wait = MICRO_BATCH_MAX_WAIT_NER if self.ner_model_loaded else MICRO_BATCH_MAX_WAIT
+            else:
+                max_wait = 0.0
+            
+            # 첫 요청 이후 최대 대기 시간 동안 추가 요청 수집
+            deadline = time.monotonic() + max_wait
+            while len(requests) < MICRO_BATCH_MAX_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    requests.append(self._request_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            previous_size = len(requests)
+            
+            # 길이 구간별로 나누어 처리 (구간 안에서는 도착 순서 유지)
+            buckets: Dict[int, List[Tuple[str, Future]]] = {}
+            for request in requests:
+                buckets.setdefault(bisect_left(LENGTH_BUCKETS, len(request[0])), []).append(request)
+            
+            for bucket_index in sorted(buckets):
+                bucket = [(text, future) for text, future in buckets[bucket_index]
+                          if future.set_running_or_notify_cancel()]
+                if not bucket:
+                    continue
+                try:
+                    results = run_sync(self.pseudonymize_batch([text for text, _ in bucket]))
+                except Exception as e:
+                    for _, future in bucket:
+                        future.set_exception(e)
+                    continue
+                for (_, future), result in zip(bucket, results):
+                    future.set_result(result)
     
     def reset_counters(self):
         """카운터 리셋"""
@@ -55,20 +457,53 @@ class PseudonymizationManager:
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보 반환"""
         if self.pools:
-            return get_data_pool_stats()
+            stats = get_data_pool_stats()
+            with self._stats_lock:
+                stats["timings"] = {key: value.to_dict() for key, value in self.timing_stats.items()}
+                stats["latency"] = self.latency.percentiles()
+                stats["latency"]["mean"] = self.latency.mean()
+            with self._cache_lock:
+                stats["cache"] = {
+                    "size": len(self._result_cache),
+                    "hits": self.cache_hits,
+                    "misses": self.cache_misses
+                }
+            return stats
         return {}
 
 # 전역 매니저 인스턴스
-_manager: Optional[PseudonymizationManager] = None
+# ⭐ 인스턴스는 import 시 생성 (생성 자체는 가벼움), 무거운 초기화는 첫 get_manager() 호출에서 한 번만
+# (import 시점에 초기화 스레드를 띄우면 preload_for_fork() 이후 fork한 자식에 스레드가 남지 않으므로)
+_manager = PseudonymizationManager()
+_manager_started = False
+_manager_lock = threading.Lock()  # 동시 요청에서 초기화(NER 모델 로드 포함)가 두 번 실행되지 않도록
 
 def get_manager() -> PseudonymizationManager:
-    """매니저 인스턴스 반환"""
-    global _manager
-    if _manager is None:
-        _manager = PseudonymizationManager()
-        _manager.initialize()
+    """매니저 인스턴스 반환 (초기화 성공 이후에는 플래그 하나만 확인, 실패하면 다음 호출에서 재시도)"""
+    global _manager_started
+    if not _manager_started:
+        with _manager_lock:
+            if not _manager_started:
+                _manager_started = _manager.initialize()
     return _manager
 
+def preload_for_fork() -> bool:
+    """워커 프로세스를 fork하기 전에 부모에서 NER 모델 미리 로드 (CPU 장치에서만)
+
+    자식 프로세스는 모델 가중치 페이지를 copy-on-write로 공유하고, 자식의 get_manager()는
+    이미 로드된 모델을 그대로 사용. 스레드(배치 워커, 공용 이벤트 루프)는 fork 후 자식에
+    남지 않으므로 매니저 자체는 여기서 만들지 않음.
+
+    모델이 로드되면 gc.freeze()로 현재 객체를 GC 대상에서 제외하므로, 호출한 뒤에는 곧바로
+    fork해야 함 (부모가 계속 실행되면 freeze된 객체는 순환 참조가 있어도 회수되지 않음).
+    """
+    loaded = False
+    if NER_AVAILABLE and is_ner_available():
+        loaded = preload_ner_model_for_fork()
+    if loaded:
+        gc.freeze()  # 이후 GC가 부모 객체를 건드려 공유 페이지가 복사되지 않도록
+    return loaded
+
 def is_manager_ready() -> bool:
     """매니저 준비 상태 확인"""
     try:
@@ -78,10 +513,12 @@ def is_manager_ready() -> bool:
         return False
 
 def get_manager_status() -> Dict[str, Any]:
-    """매니저 상태 반환"""
+    """매니저 상태 반환 (외부 공개용 - stats는 복사본이라 JSON 직렬화 가능)"""
     try:
         manager = get_manager()
-        return manager.get_status()
+        status = manager.get_status()
+        status["stats"] = manager.snapshot_stats()
+        return status
     except Exception as e:
         return {
             "initialized": False,
@@ -93,4 +530,9 @@ def get_manager_status() -> Dict[str, Any]:
 async def pseudonymize_with_manager(text: str) -> Dict[str, Any]:
     """매니저를 통한 가명화"""
     manager = get_manager()
-    return await manager.pseudonymize(text)
\ No newline at end of file
+    return await manager.pseudonymize(text)
+
+async def pseudonymize_batch_with_manager(texts: List[str]) -> List[Dict[str, Any]]:
+    """매니저를 통한 일괄 가명화 (NER은 배치 단위로 한 번에 실행, 입력 순서대로 결과 반환)"""
+    manager = get_manager()
+    return await manager.pseudonymize_batch(texts)
\ No newline at end of file
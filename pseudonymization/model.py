@@ -3,9 +3,18 @@
 NER 모델 관리 모듈 - KPF/KPF-bert-ner 라벨 매핑 수정
 """
 
+import os
 import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+log = logging.getLogger(__name__)
+
 # NER 관련 라이브러리 (선택적)
 try:
     import torch
@@ -17,7 +26,29 @@ try:
     NER_AVAILABLE = True
 except ImportError:
     NER_AVAILABLE = False
-    print("transformers 라이브러리가 설치되지 않았습니다")
+    log.warning("transformers 라이브러리가 설치되지 않았습니다")
+
+# accelerate (선택적 - low_cpu_mem_usage 로드에 필요)
+try:
+    import accelerate  # noqa: F401
+    ACCELERATE_AVAILABLE = True
+except ImportError:
+    ACCELERATE_AVAILABLE = False
+
+# ONNX Runtime (선택적 - CPU 추론 가속, optimum으로 변환)
+try:
+    from onnxruntime import SessionOptions, GraphOptimizationLevel
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# numpy (선택적 - 엔티티 신뢰도 필터 벡터화)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # KPF BERT NER 모델
 NER_MODELS = [
@@ -25,6 +56,99 @@ NER_MODELS = [
     "monologg/koelectra-base-v3-naver-ner",  # 백업 모델
 ]
 
+# PyTorch 2.0 이상에서 NER forward를 torch.compile로 컴파일 (실패하면 eager 실행)
+TORCH_COMPILE = True
+
+# CPU 추론 시 ONNX Runtime 사용 (optimum/onnxruntime 설치 시, 실패하면 PyTorch 모델 사용)
+USE_ONNX_CPU = True
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ai_g", "onnx")  # 변환 결과 재사용
+
+# CPU 추론 시 Linear 계층 INT8 동적 양자화 (실패하면 FP32 모델 그대로 사용)
+QUANTIZE_CPU_INT8 = True
+
+# 이 점수를 넘는 엔티티만 채택 (높은 신뢰도만)
+NER_SCORE_THRESHOLD = 0.8
+
+# NER 결과 캐시 최대 항목 수 (같은 텍스트는 모델 추론 생략)
+NER_CACHE_SIZE = 4096
+
+def _entity_key(text: str) -> bytes:
+    """NER 결과 캐시 키 (blake2b 128비트 해시)"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+# NER 라벨 → PII 타입 매핑 (접두사 없는 대문자 라벨 기준)
+LABEL_TYPE_MAPPING = {
+    'PER': '이름',
+    'PERSON': '이름',
+    'LOC': '주소',
+    'LOCATION': '주소',
+    'ORG': '조직',
+    'ORGANIZATION': '조직',
+    'PHONE': '전화번호',
+    'EMAIL': '이메일',
+    'MISC': '기타'
+}
+
+# ⭐ B-/I- 접두사 × 대소문자 변형을 미리 펼친 조회표 (조회 시 문자열 연산 없음)
+LABEL_TYPE_TABLE: Dict[str, str] = {
+    prefix + variant: pii_type
+    for base, pii_type in LABEL_TYPE_MAPPING.items()
+    for prefix in ("", "B-", "I-")
+    for variant in (base, base.lower(), base.title())
+}
+
+@lru_cache(maxsize=128)
+def _map_label_to_type(label: str) -> Optional[str]:
+    """매핑된 라벨을 PII 타입으로 변환 (조회표에 없는 라벨(O, LABEL_n 등)도 결과 캐시)"""
+    pii_type = LABEL_TYPE_TABLE.get(label)
+    if pii_type is None:
+        # B-, I- 접두사 제거 후 대문자 기준 매핑
+        pii_type = LABEL_TYPE_MAPPING.get(label.replace('B-', '').replace('I-', '').upper())
+    return pii_type
+
+def _confident_indices(raw_entities: List[Dict[str, Any]]) -> List[int]:
+    """점수가 임계값을 넘는 엔티티 인덱스 (numpy 있으면 한 번에 마스크 계산)"""
+    if NUMPY_AVAILABLE and raw_entities:
+        scores = np.fromiter(
+            (e.get('score', 0.0) for e in raw_entities),
+            dtype=np.float64, count=len(raw_entities)
+        )
+        return np.flatnonzero(scores > NER_SCORE_THRESHOLD).tolist()
+    return [i for i, e in enumerate(raw_entities)
+            if float(e.get('score', 0.0)) > NER_SCORE_THRESHOLD]
+
+def _detect_device():
+    """최적의 디바이스 선택 (임포트 시 한 번만 프로브 - CUDA 컨텍스트는 만들지 않음)"""
+    if not NER_AVAILABLE:
+        return -1
+    
+    if torch.cuda.is_available():
+        return 0  # GPU
+    elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        return "mps"  # Apple Silicon
+    else:
+        return -1  # CPU
+
+# ⭐ 디바이스 프로브는 프로세스당 한 번만 (get_status/load_model마다 CUDA 런타임 조회 방지)
+_DEVICE = _detect_device()
+_device_dtype_cache = None
+
+def _get_device_dtype():
+    """(디바이스 이름, dtype) 반환 - dtype은 최초 호출 시 계산"""
+    global _device_dtype_cache
+    if _device_dtype_cache is None:
+        if not NER_AVAILABLE:
+            _device_dtype_cache = ("cpu", None)
+        elif _DEVICE == 0:
+            # CUDA는 fp16 (bf16은 requirements의 transformers>=4.21 파이프라인 후처리에서
+            # logits.numpy()가 bfloat16을 지원하지 않아 실패)
+            _device_dtype_cache = ("cuda", torch.float16)
+        elif _DEVICE == "mps":
+            _device_dtype_cache = ("mps", torch.float16)
+        else:
+            _device_dtype_cache = ("cpu", torch.float32)
+    return _device_dtype_cache
+
 class WorkingNERModel:
     """KPF BERT NER 모델 클래스 (라벨 매핑 수정)"""
     
@@ -37,18 +161,113 @@ class WorkingNERModel:
         self.model_name = None
         self.id2label = None
         self.label_map = None  # 수동 라벨 매핑 추가
+        self.quantized = False
+        self.onnx = False
+        self.compiled = False
+        self._entity_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def _get_device(self):
-        """최적의 디바이스 선택"""
-        if not NER_AVAILABLE:
-            return -1
+        """최적의 디바이스 선택 (임포트 시 계산된 값)"""
+        return _DEVICE
+    
+    def _load_dtype(self):
+        """가중치 로드 dtype (CUDA/MPS는 fp16 / CPU는 기본 fp32)"""
+        if self.device not in (0, "mps"):
+            return None
+        return _get_device_dtype()[1]
+    
+    def _quantize_for_cpu(self, model):
+        """CPU용 INT8 동적 양자화 (Linear 가중치만 int8, 활성값은 실행 중 양자화)"""
+        if not QUANTIZE_CPU_INT8 or self.device != -1:
+            return model
+        
+        # 양자화 백엔드 선택 (x86: fbgemm - VNNI/AVX512에서 int8 내적 / ARM: qnnpack), 없으면 FP32 유지
+        engines = torch.backends.quantized.supported_engines
+        engine = next((name for name in ("fbgemm", "x86", "qnnpack") if name in engines), None)
+        if engine is None:
+            log.warning("⚠️ INT8 양자화 백엔드 없음 (FP32 사용)")
+            return model
+        
+        try:
+            torch.backends.quantized.engine = engine
+            quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.quantized = True
+            log.info("⚡ INT8 동적 양자화 적용 (CPU, %s)", engine)
+            return quantized
+        except Exception as e:
+            log.warning("⚠️ INT8 양자화 실패 (FP32 사용): %s", e)
+            return model
+    
+    def _compile_forward(self, model):
+        """torch.compile로 forward 컴파일 (커널 융합) - torch<2.0, 양자화/ONNX 모델은 제외"""
+        if not TORCH_COMPILE or not hasattr(torch, "compile") or self.quantized or self.onnx:
+            return
+        
+        try:
+            # 클래스는 그대로 두고 forward만 교체 (파이프라인의 모델 타입 검사 유지)
+            # ⭐ CUDA 그래프(reduce-overhead)는 쓰지 않음 - 입력 길이마다 그래프/메모리 풀이 늘어나고
+            # 여러 스레드에서 동시에 호출하면 안전하지 않음
+            model.forward = torch.compile(model.forward, mode="default", dynamic=True)
+            self.compiled = True
+            log.info("⚡ torch.compile 적용")
+        except Exception as e:
+            log.warning("⚠️ torch.compile 실패 (eager 사용): %s", e)
+    
+    def _load_onnx_model(self, model_name: str):
+        """CPU용 ONNX Runtime 모델 로드 (그래프 최적화 전체 적용, 최초 1회만 변환 / 실패 시 None)"""
+        if not USE_ONNX_CPU or not ONNX_AVAILABLE or self.device != -1:
+            return None
+        
+        try:
+            options = SessionOptions()
+            options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
             
-        if torch.cuda.is_available():
-            return 0  # GPU
-        elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            return "mps"  # Apple Silicon
-        else:
-            return -1  # CPU
+            export_dir = os.path.join(ONNX_CACHE_DIR, model_name.replace("/", "__"))
+            exported = os.path.isfile(os.path.join(export_dir, "model.onnx"))
+            model = ORTModelForTokenClassification.from_pretrained(
+                export_dir if exported else model_name,
+                export=not exported,
+                session_options=options,
+                provider="CPUExecutionProvider"
+            )
+            if not exported:
+                model.save_pretrained(export_dir)
+            
+            self.onnx = True
+            log.info("⚡ ONNX Runtime 사용 (CPU, 스레드 %s개)", options.intra_op_num_threads)
+            return model
+        except Exception as e:
+            log.warning("⚠️ ONNX 변환/로드 실패 (PyTorch 사용): %s", e)
+            return None
+    
+    def _cache_get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 엔티티 목록 반환 (호출자가 수정해도 캐시에 영향 없도록 항목 복사)"""
+        with self._cache_lock:
+            cached = self._entity_cache.get(key)
+            if cached is None:
+                self.cache_misses += 1
+                return None
+            self._entity_cache.move_to_end(key)
+            self.cache_hits += 1
+        return [dict(entity) for entity in cached]
+    
+    def _cache_put(self, key: bytes, entities: List[Dict[str, Any]]):
+        """엔티티 목록을 캐시에 저장 (가장 오래 사용하지 않은 항목부터 제거)"""
+        snapshot = [dict(entity) for entity in entities]
+        with self._cache_lock:
+            self._entity_cache[key] = snapshot
+            self._entity_cache.move_to_end(key)
+            while len(self._entity_cache) > NER_CACHE_SIZE:
+                self._entity_cache.popitem(last=False)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """NER 결과 캐시 상태"""
+        with self._cache_lock:
+            return {"size": len(self._entity_cache), "hits": self.cache_hits, "misses": self.cache_misses}
     
     def is_loaded(self) -> bool:
         """모델 로드 상태 확인"""
@@ -75,28 +294,44 @@ class WorkingNERModel:
             'LABEL_299': 'O',       # 일반 텍스트 (고객님, 예약이... 등)
         }
         
-        print(f"🗺️ 수동 라벨 매핑 생성: {len(self.label_map)}개 매핑")
+        log.info("🗺️ 수동 라벨 매핑 생성: %s개 매핑", len(self.label_map))
         for label_id, mapped in self.label_map.items():
-            print(f"  - {label_id} -> {mapped}")
+            log.debug("  - %s -> %s", label_id, mapped)
     
     def load_model(self) -> bool:
         """KPF BERT NER 모델 로드"""
         if not NER_AVAILABLE:
-            print("NER 모델을 로드할 수 없습니다 - transformers 라이브러리가 필요합니다")
+            log.error("NER 모델을 로드할 수 없습니다 - transformers 라이브러리가 필요합니다")
             return False
         
         for model_name in NER_MODELS:
             try:
-                print(f"NER 모델 로딩 중: {model_name}")
+                log.info("NER 모델 로딩 중: %s", model_name)
                 
                 # 토크나이저와 모델 로드
-                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-                self.model = AutoModelForTokenClassification.from_pretrained(model_name)
+                # ⭐ Rust 기반 fast 토크나이저 사용 (aggregation_strategy="max"의 오프셋 계산에도 필요)
+                self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+                if not self.tokenizer.is_fast:
+                    log.warning("⚠️ fast 토크나이저 없음 (Python 토크나이저 사용): %s", model_name)
+                # ⭐ CPU에서는 ONNX Runtime 우선 (융합 커널), 불가하면 PyTorch 모델
+                self.model = self._load_onnx_model(model_name)
+                if self.model is None:
+                    # ⭐ GPU에서는 처음부터 반정밀도로 로드 (FP32로 읽은 뒤 변환하지 않음)
+                    # safetensors 가중치가 있으면 mmap으로 읽고, accelerate가 있으면 임시 FP32 사본 없이 로드
+                    self.model = AutoModelForTokenClassification.from_pretrained(
+                        model_name,
+                        torch_dtype=self._load_dtype(),
+                        low_cpu_mem_usage=ACCELERATE_AVAILABLE
+                    )
+                    self.model.eval()
+                    self.model.requires_grad_(False)  # 추론 전용 - autograd 메타데이터 불필요
+                    self.model = self._quantize_for_cpu(self.model)
+                    self._compile_forward(self.model)
                 self.model_name = model_name
                 
                 # 라벨 매핑 저장
                 self.id2label = self.model.config.id2label
-                print(f"📋 원본 라벨 개수: {len(self.id2label)}")
+                log.info("📋 원본 라벨 개수: %s", len(self.id2label))
                 
                 # 수동 매핑 생성
                 self._create_manual_label_map()
@@ -112,150 +347,287 @@ class WorkingNERModel:
                 
                 # 디바이스 설정 출력
                 if self.device == 0:
-                    print("장치 설정: GPU 사용")
+                    log.info("장치 설정: GPU 사용")
                 elif self.device == "mps":
-                    print("장치 설정: Apple Silicon 사용")
+                    log.info("장치 설정: Apple Silicon 사용")
                 else:
-                    print("장치 설정: CPU 사용")
+                    log.info("장치 설정: CPU 사용")
                 
-                # 테스트
+                # 테스트 (컴파일된 경우 첫 호출의 트레이스 비용도 여기서 지불)
                 test_text = "김철수는 서울 강남구에 살고 있습니다."
-                test_result = self.pipeline(test_text)
-                print(f"🧪 모델 테스트 결과: {len(test_result)}개 엔티티 탐지")
+                try:
+                    with torch.inference_mode():
+                        test_result = self.pipeline(test_text)
+                except Exception as e:
+                    if not self.compiled:
+                        raise
+                    log.warning("⚠️ 컴파일된 모델 실행 실패 (eager 사용): %s", e)
+                    del self.model.forward  # 인스턴스 속성 제거 → 원래 forward
+                    self.compiled = False
+                    with torch.inference_mode():
+                        test_result = self.pipeline(test_text)
+                log.info("🧪 모델 테스트 결과: %s개 엔티티 탐지", len(test_result))
                 
                 self.loaded = True
-                print(f"✅ NER 모델 로드 성공: {model_name}")
+                log.info("✅ NER 모델 로드 성공: %s", model_name)
                 return True
                 
             except Exception as e:
-                print(f"❌ 모델 {model_name} 로드 실패: {e}")
+                log.error("❌ 모델 %s 로드 실패: %s", model_name, e)
                 continue
         
-        print("❌ 모든 NER 모델 로드 실패")
+        log.error("❌ 모든 NER 모델 로드 실패")
         return False
     
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """텍스트에서 엔티티 추출 (라벨 매핑 개선)"""
         if not self.loaded or not self.pipeline:
-            print("⚠️ NER 모델이 로드되지 않음")
+            log.warning("⚠️ NER 모델이 로드되지 않음")
             return []
         
+        key = _entity_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
             # NER 실행
-            start_time = time.time()
-            raw_entities = self.pipeline(text)
-            processing_time = time.time() - start_time
+            start_ns = time.perf_counter_ns()
+            with torch.inference_mode():  # no_grad보다 가벼움 (버전 카운터/뷰 추적 생략)
+                raw_entities = self.pipeline(text)
+            processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
-            print(f"🔍 NER 원본 출력 (간략):")
-            print(f"  입력: {text}")
-            print(f"  탐지된 개수: {len(raw_entities)}")
+            entities = self._normalize_entities(text, raw_entities)
+            self._cache_put(key, entities)
             
-            # 결과 정규화
-            entities = []
-            for i, entity in enumerate(raw_entities):
-                entity_group = entity.get('entity_group', 'UNKNOWN')
-                word = entity.get('word', '').replace('##', '')  # BERT 토큰 정리
-                score = float(entity.get('score', 0.0))
-                start = entity.get('start', 0)
-                end = entity.get('end', 0)
-                
-                # 수동 라벨 매핑 적용
-                mapped_label = self.label_map.get(entity_group, entity_group)
-                mapped_type = self._map_label_to_type(mapped_label)
-                
-                print(f"  [{i}] {entity_group} -> {mapped_label} -> {mapped_type}: '{word}' ({score:.3f})")
-                
-                if mapped_type and score > 0.8:  # 높은 신뢰도만
-                    # 연속된 토큰 병합 (김철 + ##수 -> 김철수)
-                    if (entities and 
-                        entities[-1]['type'] == mapped_type and 
-                        entities[-1]['end'] == start):
-                        # 이전 엔티티와 병합
-                        entities[-1]['value'] += word
-                        entities[-1]['text'] += word
-                        entities[-1]['end'] = end
-                        entities[-1]['confidence'] = max(entities[-1]['confidence'], score)
-                        print(f"    병합됨: '{entities[-1]['value']}'")
-                    else:
-                        # 새 엔티티 추가
-                        processed_entity = {
-                            'type': mapped_type,
-                            'label': mapped_type,
-                            'text': word,
-                            'value': word,
-                            'start': start,
-                            'end': end,
-                            'confidence': score,
-                            'model': self.model_name,
-                            'original_label': entity_group
-                        }
-                        entities.append(processed_entity)
-                        print(f"    추가됨: {processed_entity}")
-                else:
-                    print(f"    제외됨 (타입: {mapped_type}, 점수: {score:.3f})")
-            
-            print(f"🏁 NER 처리 완료: {len(entities)}개 엔티티 ({processing_time:.3f}초)")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🏁 NER 처리 완료: %s개 엔티티 (%.3f초)", len(entities), processing_time)
             return entities
             
         except Exception as e:
-            print(f"❌ NER 처리 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("❌ NER 처리 오류: %s", e, exc_info=True)
             return []
     
-    def _map_label_to_type(self, label: str) -> Optional[str]:
-        """매핑된 라벨을 PII 타입으로 변환"""
+    def extract_entities_batch(self, texts: List[str], batch_size: int = 16) -> List[List[Dict[str, Any]]]:
+        """여러 텍스트에서 엔티티 일괄 추출 (길이 역순 정렬 후 배치 단위 실행, 입력 순서로 반환)"""
+        if not texts:
+            return []
         
-        # B-, I- 접두사 제거
-        clean_label = label.replace('B-', '').replace('I-', '').upper()
+        if not self.loaded or not self.pipeline:
+            log.warning("⚠️ NER 모델이 로드되지 않음")
+            return [[] for _ in texts]
         
-        # 타입 매핑
-        type_mapping = {
-            'PER': '이름',
-            'PERSON': '이름',
-            'LOC': '주소', 
-            'LOCATION': '주소',
-            'ORG': '조직',
-            'ORGANIZATION': '조직',
-            'PHONE': '전화번호',
-            'EMAIL': '이메일',
-            'MISC': '기타'
-        }
+        # 캐시에 있는 텍스트는 추론에서 제외
+        keys = [_entity_key(text) for text in texts]
+        results: List[List[Dict[str, Any]]] = [[] for _ in texts]
+        missing = []
+        for index, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+        
+        if not missing:
+            return results
         
-        return type_mapping.get(clean_label, None)
+        try:
+            # 길이가 비슷한 텍스트끼리 배치가 되도록 길이 역순 정렬 (패딩 낭비 감소)
+            order = sorted(missing, key=lambda i: len(texts[i]), reverse=True)
+            
+            start_ns = time.perf_counter_ns()
+            with torch.inference_mode():
+                raw_results = self.pipeline([texts[i] for i in order], batch_size=batch_size)
+            processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            
+            for index, raw_entities in zip(order, raw_results):
+                results[index] = self._normalize_entities(texts[index], raw_entities)
+                self._cache_put(keys[index], results[index])
+            
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🏁 NER 일괄 처리 완료: %s개 텍스트 (%.3f초)", len(order), processing_time)
+            return results
+            
+        except Exception as e:
+            log.error("❌ NER 일괄 처리 오류: %s", e, exc_info=True)
+            return results  # 캐시 적중 결과는 유지하고 추론하지 못한 텍스트만 빈 목록
+    
+    def _normalize_entities(self, text: str, raw_entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """파이프라인 원본 출력을 PII 엔티티 목록으로 정규화"""
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔍 NER 원본 출력 (간략):")
+            log.debug("  입력: %s", text)
+            log.debug("  탐지된 개수: %s", len(raw_entities))
+        
+        # ⭐ 점수 필터를 먼저 한 번에 적용하고 살아남은 엔티티만 정규화
+        confident = _confident_indices(raw_entities)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  임계값(%s) 이하 제외: %s개", NER_SCORE_THRESHOLD, len(raw_entities) - len(confident))
+        
+        # 결과 정규화
+        entities = []
+        for i in confident:
+            entity = raw_entities[i]
+            entity_group = entity.get('entity_group', 'UNKNOWN')
+            word = entity.get('word', '').replace('##', '')  # BERT 토큰 정리
+            score = float(entity.get('score', 0.0))
+            start = entity.get('start', 0)
+            end = entity.get('end', 0)
+            
+            # 수동 라벨 매핑 적용
+            mapped_label = self.label_map.get(entity_group, entity_group)
+            mapped_type = _map_label_to_type(mapped_label)
+            
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("  [%s] %s -> %s -> %s: '%s' (%.3f)", i, entity_group, mapped_label, mapped_type, word, score)
+            
+            if mapped_type:
+                # 연속된 토큰 병합 (김철 + ##수 -> 김철수)
+                if (entities and 
+                    entities[-1]['type'] == mapped_type and 
+                    entities[-1]['end'] == start):
+                    # 이전 엔티티와 병합
+                    entities[-1]['value'] += word
+                    entities[-1]['text'] += word
+                    entities[-1]['end'] = end
+                    entities[-1]['confidence'] = max(entities[-1]['confidence'], score)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("    병합됨: '%s'", entities[-1]['value'])
+                else:
+                    # 새 엔티티 추가
+                    processed_entity = {
+                        'type': mapped_type,
+                        'label': mapped_type,
+                        'text': word,
+                        'value': word,
+                        'start': start,
+                        'end': end,
+                        'confidence': score,
+                        'model': self.model_name,
+                        'original_label': entity_group
+                    }
+                    entities.append(processed_entity)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("    추가됨: %s", processed_entity)
+            elif log.isEnabledFor(logging.DEBUG):
+                log.debug("    제외됨 (타입: %s)", mapped_type)
+        
+        return entities
 
 # 전역 모델 인스턴스
 _ner_model_instance = None
+_ner_model_lock = threading.Lock()
+_ner_load_lock = threading.Lock()  # 동시에 두 번 로드하지 않도록 (fork 전 사전 로드 + 백그라운드 로드)
+_ner_load_failed = False  # 로드가 한 번 실패하면 다시 시도하지 않음 (요청마다 다운로드/로드 반복 방지)
+_load_future: Optional[Future] = None
+_load_future_lock = threading.Lock()
 
 def get_ner_model() -> WorkingNERModel:
-    """NER 모델 싱글톤 인스턴스 반환"""
+    """NER 모델 싱글톤 인스턴스 반환 (이중 검사 잠금)"""
     global _ner_model_instance
     
     if _ner_model_instance is None:
-        _ner_model_instance = WorkingNERModel()
+        with _ner_model_lock:
+            if _ner_model_instance is None:
+                _ner_model_instance = WorkingNERModel()
     
     return _ner_model_instance
 
 def load_ner_model() -> bool:
-    """NER 모델 로드"""
+    """NER 모델 로드 (이미 로드되어 있으면 그대로 사용, 이전 로드가 실패했으면 바로 False)"""
+    global _ner_load_failed
     model = get_ner_model()
-    return model.load_model()
+    if model.is_loaded():
+        return True
+    if _ner_load_failed:
+        return False
+    with _ner_load_lock:
+        if model.is_loaded():
+            return True
+        if _ner_load_failed:
+            return False
+        loaded = model.load_model()
+        _ner_load_failed = not loaded
+        return loaded
+
+def load_ner_model_async() -> Future:
+    """NER 모델 로드를 백그라운드 스레드에서 시작하고 Future 반환
+
+    로드는 프로세스당 한 번만 시작하고 이후 호출은 같은 Future를 반환 (실패한 결과도 그대로 유지 -
+    요청마다 모델 다운로드/로드를 다시 시도하지 않도록).
+    """
+    global _load_future
+    if _load_future is not None:
+        return _load_future
+    with _load_future_lock:
+        if _load_future is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ner-load")
+            _load_future = executor.submit(load_ner_model)
+            executor.shutdown(wait=False)  # 작업이 끝나면 스레드 종료
+        return _load_future
+
+def _reset_load_future_in_child():
+    """fork된 자식에서 부모의 진행 중인 로드 Future 정리 (로드 스레드는 자식에 없어 완료되지 않음)"""
+    global _load_future, _load_future_lock
+    if _load_future is not None and not _load_future.done():
+        _load_future = None
+    _load_future_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_load_future_in_child)
+
+def _wait_for_ner_model() -> bool:
+    """NER 모델 준비 대기 (백그라운드 로드 중이면 끝날 때까지만 대기)"""
+    try:
+        return load_ner_model_async().result()
+    except Exception as e:
+        log.error("NER 모델 로드 오류: %s", e)
+        return False
+
+def preload_ner_model_for_fork() -> bool:
+    """fork 전 부모 프로세스에서 NER 모델 로드 (CPU 전용 - 자식은 가중치 페이지를 copy-on-write로 공유)
+
+    GPU(CUDA/MPS) 컨텍스트는 fork된 자식에서 사용할 수 없으므로 GPU 장치에서는 미리 로드하지 않고
+    각 워커가 직접 로드.
+    """
+    if not NER_AVAILABLE:
+        return False
+    if _DEVICE != -1:
+        log.warning("⚠️ GPU 장치에서는 fork 전 NER 사전 로드를 건너뜀 (워커별로 로드)")
+        return False
+    return load_ner_model()
 
 def extract_entities_with_ner(text: str) -> List[Dict[str, Any]]:
     """NER 모델을 사용한 개체명 추출"""
     model = get_ner_model()
     
     if not model.is_loaded():
-        # 모델이 로드되지 않았으면 로드 시도
-        if not model.load_model():
-            print("❌ NER 모델을 로드할 수 없습니다")
+        # 모델이 로드되지 않았으면 백그라운드 로드 완료까지 대기 (로드 전이면 시작)
+        if not _wait_for_ner_model():
+            log.error("❌ NER 모델을 로드할 수 없습니다")
             return []
     
     return model.extract_entities(text)
 
+def extract_entities_batch_with_ner(texts: List[str], batch_size: int = 16) -> List[List[Dict[str, Any]]]:
+    """NER 모델을 사용한 개체명 일괄 추출 (입력 순서대로 텍스트별 목록 반환)"""
+    model = get_ner_model()
+    
+    if not model.is_loaded():
+        # 모델이 로드되지 않았으면 백그라운드 로드 완료까지 대기 (로드 전이면 시작)
+        if not _wait_for_ner_model():
+            log.error("❌ NER 모델을 로드할 수 없습니다")
+            return [[] for _ in texts]
+    
+    return model.extract_entities_batch(texts, batch_size=batch_size)
+
 def is_ner_available() -> bool:
-    """NER 기능 사용 가능 여부 확인"""
-    return NER_AVAILABLE
+    """NER 기능 사용 가능 여부 확인 (transformers가 없거나 모델 로드가 실패했으면 False)"""
+    return NER_AVAILABLE and not _ner_load_failed
+
+def get_ner_cache_info() -> Dict[str, int]:
+    """NER 결과 캐시 상태 반환"""
+    return get_ner_model().cache_info()
 
 def is_ner_loaded() -> bool:
     """NER 모델 로드 상태 확인"""
@@ -271,20 +643,36 @@ def call_qwen_detect_pii(original_prompt: str, model=None, tokenizer=None, devic
         "contains_pii": len(entities) > 0
     }
 
-def pick_device_and_dtype():
-    """디바이스 및 데이터 타입 선택"""
-    if not NER_AVAILABLE:
-        return "cpu", None
-        
-    model = get_ner_model()
-    device = model.device
+# 장치 정적 정보 캐시 (최초 조회 시 한 번만 계산)
+_device_info_cache: Optional[Dict[str, Any]] = None
+
+def get_device_info() -> Dict[str, Any]:
+    """추론 장치 정보 반환 (장치 이름/총 메모리는 캐시, 사용 중 메모리만 매번 조회)"""
+    global _device_info_cache
+    
+    if _device_info_cache is None:
+        device = _DEVICE
+        info: Dict[str, Any] = {"device": "cpu"}
+        if device == 0:
+            props = torch.cuda.get_device_properties(0)
+            info.update(device="cuda", gpu_name=props.name, total_memory=props.total_memory)
+        elif device == "mps":
+            info["device"] = "mps"
+        _device_info_cache = info
     
-    if device == 0:  # GPU
-        return "cuda", torch.float16
-    elif device == "mps":  # Apple Silicon
-        return "mps", torch.float16
-    else:  # CPU
-        return "cpu", torch.float32
+    info = dict(_device_info_cache)
+    info["ner_available"] = is_ner_available()
+    model = get_ner_model()
+    info["quantized"] = model.quantized
+    info["onnx"] = model.onnx
+    info["compiled"] = model.compiled
+    if info["device"] == "cuda":
+        info["memory_allocated"] = torch.cuda.memory_allocated(0)
+    return info
+
+def pick_device_and_dtype():
+    """디바이스 및 데이터 타입 선택 (최초 호출 시 한 번만 계산)"""
+    return _get_device_dtype()
 
 def load_model():
     """모델 로드 (호환성)"""
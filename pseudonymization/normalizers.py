@@ -1,7 +1,15 @@
 # pseudonymization/normalizers.py - 이름/주소 탐지 강화 버전 (조사 제외 수정, 전화번호 중복 해결)
+import os
 import re
+import sys
 import asyncio
-from typing import Optional, Dict, List, Any
+import logging
+import threading
+from itertools import chain
+from bisect import bisect_left
+from typing import Optional, Dict, List, Any, Tuple, NamedTuple
+
+log = logging.getLogger(__name__)
 
 # ⭐ 강화된 이메일 정규식 패턴들
 EMAIL_PATTERNS = [
@@ -13,10 +21,45 @@ EMAIL_PATTERNS = [
     re.compile(r'[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Za-z]{2,}'),
 ]
 
+# ⭐ 주소 패턴의 시/도 이후 부분 (시/도 등장 위치에서만 match로 확인)
+ADDRESS_COMPLEX_TAIL_PATTERNS = (
+    re.compile(r'(?:시|도)?\s+[가-힣]+(?:구|군|시)(?:에서|에|로|으로)?'),
+    re.compile(r'\s+[가-힣]+(?:구|군)(?:에서|에|로|으로)?'),
+)
+ADDRESS_SINGLE_TAIL_RX = re.compile(r'(?:시|도)?(?:에서|에|로|으로)?')
+
+# 주소 끝 조사
+ADDRESS_PARTICLE_RX = re.compile(r'(에서|에|로|으로)$')
+
+# 주소 문맥 키워드 (전방탐색으로 겹치는 위치까지 한 번에 수집)
+ADDRESS_CONTEXT_RX = re.compile(r'(?=(거주|살고|있습니다|위치|주소|예약|지역))')
+
+# 나이 문맥 키워드
+AGE_KEYWORDS = ('세', '살', '나이', '연령', '만', '년생', '올해')
+
 AGE_RX = re.compile(r"\b(\d{1,3})\s*(?:세|살)?\b")
 PHONE_NUM_ONLY = re.compile(r"\D+")
+NON_DIGIT_RX = re.compile(r'[^0-9]')
 PHONE_PATTERN = re.compile(r'010[-\s]?\d{4}[-\s]?\d{4}')
 
+# ⭐ PII 후보 문자 (숫자/'@'/한글 음절) - 하나도 없으면 모든 탐지 생략
+PII_CANDIDATE_RX = re.compile(r'[\d@가-힣]')
+
+# ⭐ 이메일 통합 스캔 패턴 (그룹 이름으로 패턴 분기, '@'가 있을 때만 스캔)
+# 전화번호/나이와 한 패턴으로 묶지 않음 - 이메일 매치가 그 안의 전화번호/나이 후보를 소비하므로
+# (예: "01012345678a@b.com"에서 전화번호 누락)
+EMAIL_SCAN_RX = re.compile(
+    r'(?P<email>' + EMAIL_PATTERNS[0].pattern + r')'
+    r'|(?P<spaced_email>' + EMAIL_PATTERNS[2].pattern + r')'
+)
+
+# ⭐ 전화번호/나이 통합 스캔 패턴 (한 번의 스캔에서 그룹 이름으로 타입 분기)
+# 같은 위치에서는 전화번호가 먼저 시도되고, 전화번호 안의 숫자 묶음은 나이 조건(2자리 이하)을 만족하지 않음
+PRIMARY_SCAN_RX = re.compile(
+    r'(?P<phone>' + PHONE_PATTERN.pattern + r')'
+    r'|\b(?P<age>\d{1,3})\s*(?:세|살)?\b'
+)
+
 # ⭐⭐⭐ 대폭 강화된 이름 탐지 패턴 (조사 제외 수정) ⭐⭐⭐
 NAME_PATTERNS = [
     # 기존 패턴들 (조사 제외 강화)
@@ -46,11 +89,57 @@ NAME_PATTERNS = [
 
 # NER 모델 import (선택적)
 try:
-    from .model import extract_entities_with_ner, is_ner_available, is_ner_loaded
+    from .model import extract_entities_with_ner, extract_entities_batch_with_ner, is_ner_available, is_ner_loaded
     NER_AVAILABLE = True
 except ImportError:
     NER_AVAILABLE = False
 
+# 통합 스캔 패턴은 모두 '@' 또는 숫자를 포함해야 매치됨 (사전 검사용)
+PRIMARY_TRIGGER_RX = re.compile(r'[@\d]')
+
+# 이름 끝 조사 (긴 것부터 확인하도록 길이 역순 정렬)
+TRAILING_PARTICLES = tuple(sorted(
+    ['이고', '이에요', '입니다', '라고', '이', '가', '을', '를', '은', '는', '의', '와', '과', '에', '에게', '에서', '로', '으로'],
+    key=len, reverse=True
+))
+
+# 이름 검증 시 떼어내는 조사
+NAME_TRAILING_PARTICLES = ('이고', '이에요', '입니다', '라고')
+
+def _build_suffix_trie(suffixes) -> Dict[Optional[str], Any]:
+    """접미사를 뒤집어 넣은 트라이 생성 (끝 노드의 None 키에 접미사 저장)"""
+    trie: Dict[Optional[str], Any] = {}
+    for suffix in suffixes:
+        node = trie
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node[None] = suffix
+    return trie
+
+def _find_suffixes(text: str, trie: Dict[Optional[str], Any]) -> List[str]:
+    """text 끝에 붙은 접미사들을 짧은 것부터 반환 (뒤에서부터 트라이를 따라감)"""
+    found = []
+    node = trie
+    for char in reversed(text):
+        node = node.get(char)
+        if node is None:
+            break
+        if None in node:
+            found.append(node[None])
+    return found
+
+TRAILING_PARTICLE_TRIE = _build_suffix_trie(TRAILING_PARTICLES)
+NAME_TRAILING_PARTICLE_TRIE = _build_suffix_trie(NAME_TRAILING_PARTICLES)
+
+# 존칭
+HONORIFICS = ('님', '씨')
+
+# 실명 뒤에 오면 조사로 보는 글자들
+NAME_FOLLOWING_PARTICLES = ('이고', '이에')
+
+# 한글 음절만으로 이루어진 문자열 (문자별 비교 대신 한 번의 매치로 확인)
+HANGUL_ONLY_RX = re.compile(r'[\uac00-\ud7af]+')
+
 def get_pools():
     """pools.py에서 데이터풀 가져오기"""
     from .pools import get_pools
@@ -65,13 +154,10 @@ def smart_clean_korean_text(text: str, preserve_context: bool = True) -> str:
     
     # ⭐ 조사 제거 강화 - preserve_context와 관계없이 명확한 조사는 제거
     if not preserve_context:
-        # 조사 패턴 (끝에 오는 조사들)
-        particles = ['이고', '이에요', '입니다', '라고', '이', '가', '을', '를', '은', '는', '의', '와', '과', '에', '에게', '에서', '로', '으로']
         # 존칭은 보존 (님, 씨는 제거하지 않음)
-        
-        # 끝에 있는 조사들만 제거 (존칭은 보존)
-        for particle in sorted(particles, key=len, reverse=True):
-            if cleaned.endswith(particle) and len(cleaned) > len(particle) + 1:  # 최소 2글자는 남겨야 함
+        # 끝에 있는 조사들만 제거 - 끝에 붙은 조사를 긴 것부터 확인
+        for particle in reversed(_find_suffixes(cleaned, TRAILING_PARTICLE_TRIE)):
+            if len(cleaned) > len(particle) + 1:  # 최소 2글자는 남겨야 함
                 without_particle = cleaned[:-len(particle)]
                 if len(without_particle) >= 2:
                     cleaned = without_particle
@@ -79,9 +165,72 @@ def smart_clean_korean_text(text: str, preserve_context: bool = True) -> str:
     
     return cleaned
 
+def _find_literal(text: str, needle: str):
+    """고정 문자열의 (시작, 끝) 위치를 겹치지 않게 순서대로 반환 (정규식 대신 str.find 사용)"""
+    if not needle:
+        return
+    size = len(needle)
+    pos = text.find(needle)
+    while pos != -1:
+        yield pos, pos + size
+        pos = text.find(needle, pos + size)
+
+# 확장된 일반명사 목록 (이름 후보에서 제외)
+NAME_COMMON_NOUNS = frozenset({
+    "고객", "손님", "회원", "선생", "교수", "의사", "직원", "학생",
+    "친구", "선배", "후배", "동료", "가족", "부모", "자녀", "형제",
+    "자매", "사람", "분들", "여러분", "모든", "모두", "전부", "일부",
+    "담당자", "책임자", "관리자", "운영자", "개발자", "설계자", "기획자",
+    "상담원", "안내원", "접수원", "대리", "과장", "부장", "팀장", "실장",
+    "차장", "이사", "상무", "전무", "사장", "대표", "회장", "의장",
+    "이번", "다음", "저번", "처음", "마지막", "첫째", "둘째", "셋째",
+    "오늘", "어제", "내일", "지금", "나중", "앞서", "이후", "이전",
+    "그분", "이분", "저분", "누군가", "아무나", "모든", "각자", "서로",
+    "혼자", "함께", "같이", "따로", "별도", "개별", "공동", "전체",
+    # ⭐ 추가 제외 단어들
+    "뭐라", "세아", "태평", "동이"
+})
+
+# 한국어 성씨 (2글자 이름 검증용)
+COMMON_SURNAMES = frozenset({
+    "김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", 
+    "서", "신", "권", "황", "안", "송", "전", "홍", "고", "문", "양", "손"
+})
+
+# 이름 검증 결과 캐시 최대 크기 (초과 시 비움)
+NAME_VERDICT_CACHE_SIZE = 10000
+
+# 데이터풀에서 파생되는 이름 탐지용 캐시 (데이터풀 버전이 바뀔 때만 재구성)
+_name_cache: Dict[str, Any] = {"version": None}
+
+def _get_name_matchers(pools) -> Dict[str, Any]:
+    """실명 목록, 지역명 집합, 이름 검증 결과 캐시 반환"""
+    if _name_cache["version"] != pools._version:
+        _name_cache.update(
+            version=pools._version,
+            pools=pools,
+            real_names=tuple(pools.real_names),
+            real_name_set=frozenset(pools.real_names),
+            regions=frozenset(pools.provinces + pools.cities + pools.roads),
+            verdicts={},
+        )
+    return _name_cache
+
 def is_valid_korean_name(name: str, include_honorifics: bool = True) -> bool:
     """한국어 이름 유효성 검증 (존칭 포함 옵션) - 강화"""
-    pools = get_pools()
+    matchers = _get_name_matchers(get_pools())
+    verdicts = matchers["verdicts"]
+    key = (name, include_honorifics)
+    verdict = verdicts.get(key)
+    if verdict is None:
+        if len(verdicts) >= NAME_VERDICT_CACHE_SIZE:
+            verdicts.clear()
+        verdict = verdicts[key] = _check_korean_name(name, include_honorifics, matchers)
+    return verdict
+
+def _check_korean_name(name: str, include_honorifics: bool, matchers: Dict[str, Any]) -> bool:
+    """이름 유효성 실제 검증 (is_valid_korean_name에서 캐시와 함께 사용)"""
+    pools = matchers["pools"]
     
     if not name or len(name) < 2 or len(name) > 5:  # 존칭 포함하면 최대 5글자
         return False
@@ -91,26 +240,20 @@ def is_valid_korean_name(name: str, include_honorifics: bool = True) -> bool:
     has_honorific = False
     
     # 조사 제거
-    particles_to_remove = ['이고', '이에요', '입니다', '라고']
-    for particle in particles_to_remove:
-        if base_name.endswith(particle):
-            base_name = base_name[:-len(particle)]
-            break
+    particles = _find_suffixes(base_name, NAME_TRAILING_PARTICLE_TRIE)
+    if particles:
+        base_name = base_name[:-len(particles[-1])]
     
     if include_honorifics:
-        if base_name.endswith('님') or base_name.endswith('씨'):
+        if base_name.endswith(HONORIFICS):
             base_name = base_name[:-1]
             has_honorific = True
     
     if len(base_name) < 2 or len(base_name) > 4:
         return False
     
-    # 한글만 허용
-    if not all('\uac00' <= char <= '\ud7af' for char in base_name):
-        return False
-    
-    # 숫자 포함 제외
-    if any(char.isdigit() for char in base_name):
+    # 한글만 허용 (숫자 포함 제외도 함께 처리됨)
+    if not HANGUL_ONLY_RX.fullmatch(base_name):
         return False
     
     # 제외 단어들
@@ -118,208 +261,234 @@ def is_valid_korean_name(name: str, include_honorifics: bool = True) -> bool:
         return False
     
     # 확장된 일반명사 목록
-    common_nouns = {
-        "고객", "손님", "회원", "선생", "교수", "의사", "직원", "학생",
-        "친구", "선배", "후배", "동료", "가족", "부모", "자녀", "형제",
-        "자매", "사람", "분들", "여러분", "모든", "모두", "전부", "일부",
-        "담당자", "책임자", "관리자", "운영자", "개발자", "설계자", "기획자",
-        "상담원", "안내원", "접수원", "대리", "과장", "부장", "팀장", "실장",
-        "차장", "이사", "상무", "전무", "사장", "대표", "회장", "의장",
-        "이번", "다음", "저번", "처음", "마지막", "첫째", "둘째", "셋째",
-        "오늘", "어제", "내일", "지금", "나중", "앞서", "이후", "이전",
-        "그분", "이분", "저분", "누군가", "아무나", "모든", "각자", "서로",
-        "혼자", "함께", "같이", "따로", "별도", "개별", "공동", "전체",
-        # ⭐ 추가 제외 단어들
-        "뭐라", "세아", "태평", "동이"
-    }
-    
-    if base_name in common_nouns:
+    if base_name in NAME_COMMON_NOUNS:
         return False
     
     # 지역명 제외 (강화)
-    pools = get_pools()
-    all_regions = set(pools.provinces + pools.cities + pools.roads)
-    if base_name in all_regions:
+    if base_name in matchers["regions"]:
         return False
     
     # ⭐ 동명(洞名) 패턴 제외 (태평동, 신정동 등)
     if base_name.endswith('동') and len(base_name) >= 3:
         return False
     
-    # 한국어 성씨 확인 (선택적 강화)
-    common_surnames = {
-        "김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", 
-        "서", "신", "권", "황", "안", "송", "전", "홍", "고", "문", "양", "손"
-    }
-    
     # 2글자 이름인데 성씨로 시작하지 않으면 의심스러움
-    if len(base_name) == 2 and base_name[0] not in common_surnames:
-        if base_name not in pools.real_names:
+    if len(base_name) == 2 and base_name[0] not in COMMON_SURNAMES:
+        if base_name not in matchers["real_name_set"]:
             return False
     
     return True
 
+def _find_keyword_hits(text: str, keyword_rx: re.Pattern) -> Tuple[List[int], List[int]]:
+    """키워드 등장 위치를 (시작 목록, 끝 목록)으로 한 번에 수집"""
+    starts, ends = [], []
+    for match in keyword_rx.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end(1))
+    return starts, ends
+
+def _has_keyword_in_window(text: str, keywords: Tuple[str, ...], lo: int, hi: int) -> bool:
+    """text[lo:hi] 범위 안에 키워드가 하나라도 있는지 확인 (부분 문자열을 만들지 않음)"""
+    lo = max(0, lo)
+    for keyword in keywords:
+        if text.find(keyword, lo, hi) != -1:
+            return True
+    return False
+
+def _has_keyword_hit(hits: Tuple[List[int], List[int]], lo: int, hi: int) -> bool:
+    """[lo, hi) 범위 안에 완전히 들어가는 키워드가 있는지 이진 탐색으로 확인"""
+    starts, ends = hits
+    i = bisect_left(starts, max(0, lo))
+    while i < len(starts) and starts[i] < hi:
+        if ends[i] <= hi:
+            return True
+        i += 1
+    return False
+
+class _AddressCandidate(NamedTuple):
+    """주소 탐지 중간 후보 (최종 결과는 dict 항목으로 변환)"""
+    province: str
+    value: str
+    original_match: str
+    start: int
+    end: int
+    confidence: float
+    priority: int
+    has_particle: bool
+    is_complex: bool
+
+# 데이터풀에서 파생되는 주소 탐지용 캐시 (데이터풀 버전이 바뀔 때만 재구성)
+_address_cache: Dict[str, Any] = {"version": None}
+
+def _get_address_matchers(pools) -> Dict[str, Any]:
+    """시/도 시작 위치 탐색 정규식과 첫 글자별 시/도 목록 반환"""
+    if _address_cache["version"] != pools._version:
+        by_initial: Dict[str, List[Tuple[int, str]]] = {}
+        for index, province in enumerate(pools.provinces):
+            if province:
+                by_initial.setdefault(province[0], []).append((index, province))
+        
+        start_rx = None
+        if by_initial:
+            alternation = '|'.join(re.escape(p) for p in pools.provinces if p)
+            start_rx = re.compile(f'(?=(?:{alternation}))')
+        
+        _address_cache.update(version=pools._version, province_start_rx=start_rx, provinces_by_initial=by_initial)
+    return _address_cache
+
+def _find_province_hits(text: str, pools) -> List[Tuple[int, int, str]]:
+    """텍스트 내 시/도 등장 위치를 (위치, 시/도 인덱스, 시/도) 목록으로 반환 (겹침 포함)"""
+    matchers = _get_address_matchers(pools)
+    start_rx = matchers["province_start_rx"]
+    if start_rx is None:
+        return []
+    
+    by_initial = matchers["provinces_by_initial"]
+    hits = []
+    for match in start_rx.finditer(text):
+        pos = match.start()
+        for index, province in by_initial[text[pos]]:
+            if text.startswith(province, pos):
+                hits.append((pos, index, province))
+    return hits
+
 # ===== PII 탐지 함수들 (강화됨) =====
 
-def detect_emails(text: str) -> List[Dict[str, Any]]:
-    """⭐ 강화된 이메일 탐지"""
-    items = []
-    seen_emails = set()
+def _may_contain_primary_pii(text: str) -> bool:
+    """'@'나 숫자가 있는지 확인 (없으면 통합 스캔 패턴이 매치될 수 없음)"""
+    return PRIMARY_TRIGGER_RX.search(text) is not None
+
+# 탐지기 예열용 문장 (모든 탐지 경로를 한 번씩 지나가도록)
+WARM_UP_TEXT = "김철수님 010-1234-5678 test@example.com 서울시 강남구 30세"
+
+def warm_up_detectors():
+    """탐지기 캐시를 미리 구성 (첫 요청에서 컴파일/구성 비용이 들지 않도록)"""
+    pools = get_pools()
+    _get_name_matchers(pools)
+    _get_address_matchers(pools)
     
-    print(f"📧 강화된 이메일 탐지 시작: '{text}'")
+    # ⭐ 정규식 탐지를 한 번 실행 (가명 발급은 하지 않으므로 데이터풀 카운터는 그대로)
+    detect_primary_pii(WARM_UP_TEXT)
+    detect_names(WARM_UP_TEXT)
+    detect_addresses(WARM_UP_TEXT)
+    _get_sync_loop()  # 공용 이벤트 루프 스레드도 미리 시작
+
+def detect_primary_pii(text: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """⭐ 이메일/전화번호/나이 통합 탐지 (전화번호/나이는 한 번의 스캔, '@'가 있으면 이메일 스캔 추가)
+
+    Returns:
+        (이메일 목록, 전화번호 목록, 나이 목록)
+    """
+    emails, phones, ages = [], [], []
+    seen_emails, seen_phones, seen_ages = set(), set(), set()
     
-    # 1단계: 여러 패턴으로 이메일 탐지
-    for i, pattern in enumerate(EMAIL_PATTERNS):
-        print(f"  패턴 {i+1} 시도: {pattern.pattern}")
-        for match in pattern.finditer(text):
+    log.debug("📧📞 통합 스캔 시작: '%s'", text)
+    
+    # ⭐ '@'도 숫자도 없으면 어떤 패턴도 매치될 수 없으므로 스캔 생략
+    if not _may_contain_primary_pii(text):
+        log.debug("📧📞 통합 스캔 생략: 후보 문자 없음")
+        return emails, phones, ages
+    
+    matches = PRIMARY_SCAN_RX.finditer(text)
+    if '@' in text:
+        matches = chain(EMAIL_SCAN_RX.finditer(text), matches)
+    
+    for match in matches:
+        kind = match.lastgroup
+        
+        if kind == "email" or kind == "spaced_email":
             raw_email = match.group()
-            
             # 공백 제거하여 정규화
-            clean_email = re.sub(r'\s+', '', raw_email)
-            
-            print(f"    발견: '{raw_email}' → 정리: '{clean_email}'")
+            clean_email = re.sub(r'\s+', '', raw_email) if kind == "spaced_email" else raw_email
             
             # 기본 이메일 유효성 검사
-            if '@' in clean_email and '.' in clean_email.split('@')[1]:
-                email_parts = clean_email.split('@')
-                if len(email_parts) == 2 and len(email_parts[0]) > 0 and len(email_parts[1]) > 2:
-                    if clean_email not in seen_emails:
-                        seen_emails.add(clean_email)
-                        
-                        items.append({
-                            "type": "이메일",
-                            "value": clean_email.lower(),  # 소문자로 정규화
-                            "start": match.start(),
-                            "end": match.end(),
-                            "confidence": 0.95,
-                            "source": f"normalizers-이메일-패턴{i+1}",
-                            "original_match": raw_email
-                        })
-                        print(f"    ✅ 이메일 추가: '{clean_email.lower()}'")
-                    else:
-                        print(f"    🔄 중복 이메일: '{clean_email}'")
-            else:
-                print(f"    ❌ 유효하지 않은 이메일: '{clean_email}'")
-    
-    # 2단계: 특수 한국어 패턴 (이메일 키워드 포함)
-    email_context_patterns = [
-        r'([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?:으?로|에게|를|을)?\s*(?:메일|이메일|메시지|연락)',
-        r'(?:메일|이메일|연락)\s*(?:은|는|을|를)?\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})',
-        r'([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?:으?로|에|를)\s*(?:보내|전송|발송)'
-    ]
-    
-    for i, pattern in enumerate(email_context_patterns):
-        print(f"  컨텍스트 패턴 {i+1} 시도...")
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            email = match.group(1).lower()
-            print(f"    컨텍스트 발견: '{email}'")
+            local, _, domain = clean_email.partition('@')
+            if not local or len(domain) <= 2 or '.' not in domain:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("❌ 유효하지 않은 이메일: '%s'", clean_email)
+                continue
             
-            if email not in seen_emails:
-                seen_emails.add(email)
-                items.append({
-                    "type": "이메일",
-                    "value": email,
-                    "start": match.start(1),
-                    "end": match.end(1),
-                    "confidence": 0.90,
-                    "source": f"normalizers-이메일-컨텍스트{i+1}",
-                    "original_match": match.group()
-                })
-                print(f"    ✅ 컨텍스트 이메일 추가: '{email}'")
-    
-    print(f"📧 강화된 이메일 탐지 완료: {len(items)}개")
-    return items
-
-def detect_phones(text: str) -> List[Dict[str, Any]]:
-    """전화번호 탐지 (정확도 개선, 연속 숫자 형태 포함)"""
-    items = []
-    seen_phones = set()
-    
-    # 1. 기존 패턴 (하이픈/공백 포함)
-    for match in PHONE_PATTERN.finditer(text):
-        phone = match.group()
-        normalized_phone = phone.replace(' ', '').replace('-', '')
+            email = clean_email.lower()  # 소문자로 정규화
+            if email in seen_emails:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("🔄 중복 이메일: '%s'", clean_email)
+                continue
+            seen_emails.add(email)
+            
+            emails.append({
+                "type": "이메일",
+                "value": email,
+                "start": match.start(),
+                "end": match.end(),
+                "confidence": 0.95,
+                "source": "normalizers-이메일-패턴1" if kind == "email" else "normalizers-이메일-패턴3",
+                "original_match": raw_email
+            })
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 이메일 추가: '%s'", email)
         
-        if len(normalized_phone) == 11 and normalized_phone.startswith('010'):
+        elif kind == "phone":
+            phone = match.group()
+            normalized_phone = phone.replace(' ', '').replace('-', '')
+            
+            if len(normalized_phone) != 11:
+                continue
+            
             formatted_phone = f"{normalized_phone[:3]}-{normalized_phone[3:7]}-{normalized_phone[7:]}"
+            if formatted_phone in seen_phones:
+                continue
+            seen_phones.add(formatted_phone)
             
-            if formatted_phone not in seen_phones:
-                seen_phones.add(formatted_phone)
-                items.append({
-                    "type": "전화번호",
-                    "value": formatted_phone,
-                    "start": match.start(),
-                    "end": match.end(),
-                    "confidence": 0.95,
-                    "source": "normalizers-전화번호",
-                    "normalized": normalized_phone  # ⭐ 정규화된 값 추가
-                })
-                print(f"  ✅ 전화번호 (패턴): '{phone}' → '{formatted_phone}' (정규화: {normalized_phone})")
-    
-    # 2. ⭐ 연속된 11자리 숫자 패턴 (01012345678)
-    continuous_pattern = re.compile(r'\b(010\d{8})\b')
-    for match in continuous_pattern.finditer(text):
-        phone = match.group()
+            phones.append({
+                "type": "전화번호",
+                "value": formatted_phone,  # ⭐ 항상 포맷팅된 형태로 저장
+                "start": match.start(),
+                "end": match.end(),
+                "confidence": 0.95,
+                "source": "normalizers-전화번호",
+                "normalized": normalized_phone  # ⭐ 정규화된 값 추가
+            })
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 전화번호: '%s' → '%s' (정규화: %s)", phone, formatted_phone, normalized_phone)
         
-        # 이미 위의 패턴으로 탐지된 것과 중복인지 확인
-        if phone not in [item.get("normalized", "") for item in items]:
-            formatted_phone = f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
+        else:  # kind == "age"
+            age_str = match.group("age")
+            if age_str in seen_ages or len(age_str) > 2 or not 1 <= int(age_str) <= 120:
+                continue
             
-            if formatted_phone not in seen_phones:
-                seen_phones.add(formatted_phone)
-                items.append({
-                    "type": "전화번호",
-                    "value": formatted_phone,  # ⭐ 항상 포맷팅된 형태로 저장
+            # 앞뒤 10자 범위 안에 나이 관련 키워드가 있는지 확인
+            if _has_keyword_in_window(text, AGE_KEYWORDS, match.start() - 10, match.end() + 10):
+                seen_ages.add(age_str)
+                ages.append({
+                    "type": "나이",
+                    "value": age_str,
                     "start": match.start(),
                     "end": match.end(),
-                    "confidence": 0.95,
-                    "source": "normalizers-전화번호-연속",
-                    "normalized": phone,  # ⭐ 정규화된 값 추가
-                    "original_form": "continuous"  # 원본이 연속 형태였음을 표시
+                    "confidence": 1.0,
+                    "source": "normalizers-나이"
                 })
-                print(f"  ✅ 전화번호 (연속): '{phone}' → '{formatted_phone}' (정규화: {phone})")
     
-    return items
+    log.debug("📧📞 통합 스캔 완료: 이메일 %s개, 전화번호 %s개, 나이 %s개", len(emails), len(phones), len(ages))
+    return emails, phones, ages
+
+def detect_emails(text: str) -> List[Dict[str, Any]]:
+    """⭐ 강화된 이메일 탐지"""
+    return detect_primary_pii(text)[0]
+
+def detect_phones(text: str) -> List[Dict[str, Any]]:
+    """전화번호 탐지 (정확도 개선, 연속 숫자 형태 포함)"""
+    return detect_primary_pii(text)[1]
 
 def detect_ages(text: str) -> List[Dict[str, Any]]:
     """나이 탐지 (엄격한 검증)"""
-    items = []
-    seen_ages = set()
-    
-    for match in AGE_RX.finditer(text):
-        age_str = match.group(1)
-        
-        if age_str in seen_ages:
-            continue
-        
-        try:
-            age = int(age_str)
-            if 1 <= age <= 120 and len(age_str) <= 2:
-                start_pos = max(0, match.start() - 10)
-                end_pos = min(len(text), match.end() + 10)
-                context = text[start_pos:end_pos]
-                
-                age_keywords = ['세', '살', '나이', '연령', '만', '년생', '올해']
-                if any(keyword in context for keyword in age_keywords):
-                    seen_ages.add(age_str)
-                    items.append({
-                        "type": "나이",
-                        "value": age_str,
-                        "start": match.start(),
-                        "end": match.end(),
-                        "confidence": 1.0,
-                        "source": "normalizers-나이"
-                    })
-        except ValueError:
-            continue
-    return items
+    return detect_primary_pii(text)[2]
 
 def detect_names(text: str) -> List[Dict[str, Any]]:
     """⭐⭐⭐ 대폭 강화된 이름 탐지 (조사 제외 강화) ⭐⭐⭐"""
     items = []
     detected_names = set()
     
-    print(f"🔍 대폭 강화된 이름 탐지 시작 (조사 제외): '{text}'")
+    log.debug("🔍 대폭 강화된 이름 탐지 시작 (조사 제외): '%s'", text)
     
     # 1. 패턴 기반 탐지 (조사 제외 강화)
     for i, pattern in enumerate(NAME_PATTERNS):
@@ -337,21 +506,25 @@ def detect_names(text: str) -> List[Dict[str, Any]]:
             cleaned_base_name = smart_clean_korean_text(base_name, preserve_context=False)
             full_name = cleaned_base_name + (honorific or "")
             
-            print(f"  패턴 {i+1}: 원본 '{base_name}' → 정리 '{cleaned_base_name}' + 존칭 '{honorific}' = '{full_name}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("패턴 %s: 원본 '%s' → 정리 '%s' + 존칭 '%s' = '%s'", i+1, base_name, cleaned_base_name, honorific, full_name)
             
             # ⭐ 기본 이름으로 유효성 검사 (강화됨)
             if not is_valid_korean_name(cleaned_base_name, include_honorifics=False):
-                print(f"    ❌ 유효하지 않은 기본 이름: '{cleaned_base_name}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("❌ 유효하지 않은 기본 이름: '%s'", cleaned_base_name)
                 continue
             
             # ⭐ 존칭이 있는 경우 전체 이름도 검사
             if honorific and not is_valid_korean_name(full_name, include_honorifics=True):
-                print(f"    ❌ 유효하지 않은 전체 이름: '{full_name}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("❌ 유효하지 않은 전체 이름: '%s'", full_name)
                 continue
             
             # 중복 제거 (기본 이름 기준)
             if cleaned_base_name in detected_names:
-                print(f"    🔄 중복 제거: '{cleaned_base_name}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("🔄 중복 제거: '%s'", cleaned_base_name)
                 continue
             
             # ⭐ 존칭이 있는 경우 전체 이름을 저장, 없으면 기본 이름만
@@ -370,22 +543,21 @@ def detect_names(text: str) -> List[Dict[str, Any]]:
                 "original_match": base_name  # 원본 매치 기록
             })
             detected_names.add(cleaned_base_name)  # 기본 이름으로 중복 체크
-            print(f"    ✅ 이름 탐지: '{final_name}' (패턴 {i+1}: 기본 '{cleaned_base_name}', 존칭 '{honorific}')")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 이름 탐지: '%s' (패턴 %s: 기본 '%s', 존칭 '%s')", final_name, i+1, cleaned_base_name, honorific)
     
     # 2. 실명 목록 기반 탐지 (존칭 포함)
-    pools = get_pools()
-    for real_name in pools.real_names:
+    matchers = _get_name_matchers(get_pools())
+    for real_name in matchers["real_names"]:
         if real_name in detected_names:
             continue
         
         # 기본 이름 매칭
-        for match in re.finditer(re.escape(real_name), text):
+        for start_pos, end_pos in _find_literal(text, real_name):
             # 앞뒤 문맥 확인하여 존칭 포함 여부 판단
-            start_pos = match.start()
-            end_pos = match.end()
             
             # 뒤에 존칭이 있는지 확인
-            if end_pos < len(text) and text[end_pos:end_pos+1] in ['님', '씨']:
+            if end_pos < len(text) and text[end_pos:end_pos+1] in HONORIFICS:
                 full_name = real_name + text[end_pos]
                 end_pos += 1
                 has_honorific = True
@@ -396,8 +568,9 @@ def detect_names(text: str) -> List[Dict[str, Any]]:
             # ⭐ 뒤에 조사가 있는지 확인하여 제외
             if end_pos < len(text):
                 next_chars = text[end_pos:end_pos+2]
-                if any(next_chars.startswith(particle) for particle in ['이고', '이에']):
-                    print(f"  ⚠️ 실명 목록: '{real_name}' 뒤에 조사 발견, 이름만 추출")
+                if next_chars.startswith(NAME_FOLLOWING_PARTICLES):
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("⚠️ 실명 목록: '%s' 뒤에 조사 발견, 이름만 추출", real_name)
             
             items.append({
                 "type": "이름",
@@ -411,9 +584,10 @@ def detect_names(text: str) -> List[Dict[str, Any]]:
                 "honorific": text[end_pos-1] if has_honorific else ""
             })
             detected_names.add(real_name)
-            print(f"  ✅ 실명 목록: '{full_name}' (기본: '{real_name}')")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 실명 목록: '%s' (기본: '%s')", full_name, real_name)
     
-    print(f"🔍 대폭 강화된 이름 탐지 완료 (조사 제외): {len(items)}개")
+    log.debug("🔍 대폭 강화된 이름 탐지 완료 (조사 제외): %s개", len(items))
     return items
 
 def detect_addresses(text: str) -> List[Dict[str, Any]]:
@@ -422,106 +596,121 @@ def detect_addresses(text: str) -> List[Dict[str, Any]]:
     pools = get_pools()
     all_addresses = []
     
-    print(f"🏠 강화된 주소 탐지 시작: '{text}'")
+    log.debug("🏠 강화된 주소 탐지 시작: '%s'", text)
+    
+    # 0. 시/도 등장 위치를 한 번에 수집 (이후 정규식은 해당 위치에서만 확인)
+    province_hits = _find_province_hits(text, pools)
     
     # 1. 복합 주소 패턴 (조사 포함 버전)
-    for province in pools.provinces:
-        complex_patterns = [
-            rf'{re.escape(province)}(?:시|도)?\s+[가-힣]+(?:구|군|시)(?:에서|에|로|으로)?',
-            rf'{re.escape(province)}\s+[가-힣]+(?:구|군)(?:에서|에|로|으로)?',
-        ]
-        
-        for pattern in complex_patterns:
-            for match in re.finditer(pattern, text):
-                full_match = match.group()
-                
-                # ⭐ 조사는 분리하되 컨텍스트는 보존
-                clean_match = re.sub(r'(에서|에|로|으로)$', '', full_match).strip()
-                
-                print(f"  복합 패턴: '{full_match}' → 정리: '{clean_match}'")
-                
-                all_addresses.append({
-                    "province": province,
-                    "value": clean_match,
-                    "original_match": full_match,
-                    "start": match.start(),
-                    "end": match.end(),
-                    "confidence": 0.95,
-                    "priority": 1,  # ⭐ 복합 주소가 최우선
-                    "has_particle": full_match != clean_match,
-                    "is_complex": True  # ⭐ 복합 주소 플래그
-                })
+    last_end = {}  # (시/도, 패턴)별 마지막 매치 끝 위치 - finditer와 같은 비중첩 규칙
+    for pos, province_index, province in province_hits:
+        for pattern_index, tail_pattern in enumerate(ADDRESS_COMPLEX_TAIL_PATTERNS):
+            key = (province_index, pattern_index)
+            if pos < last_end.get(key, 0):
+                continue
+            match = tail_pattern.match(text, pos + len(province))
+            if not match:
+                continue
+            last_end[key] = match.end()
+            full_match = text[pos:match.end()]
+            
+            # ⭐ 조사는 분리하되 컨텍스트는 보존
+            clean_match = ADDRESS_PARTICLE_RX.sub('', full_match).strip()
+            
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("복합 패턴: '%s' → 정리: '%s'", full_match, clean_match)
+            
+            all_addresses.append(_AddressCandidate(
+                province=province,
+                value=clean_match,
+                original_match=full_match,
+                start=pos,
+                end=match.end(),
+                confidence=0.95,
+                priority=1,  # ⭐ 복합 주소가 최우선
+                has_particle=full_match != clean_match,
+                is_complex=True  # ⭐ 복합 주소 플래그
+            ))
     
     # 2. 단일 주소 패턴 (복합 주소가 없을 때만)
     if not all_addresses:  # ⭐ 복합 주소가 이미 있으면 단일 주소는 스킵
-        for province in pools.provinces:
-            pattern = rf'{re.escape(province)}(?:시|도)?(?:에서|에|로|으로)?'
-            for match in re.finditer(pattern, text):
-                full_match = match.group()
-                clean_match = re.sub(r'(에서|에|로|으로)$', '', full_match).strip()
-                
-                print(f"  단일 패턴: '{full_match}' → 정리: '{clean_match}'")
-                
-                start_pos = max(0, match.start() - 15)
-                end_pos = min(len(text), match.end() + 15)
-                context = text[start_pos:end_pos]
-                
-                address_keywords = ['거주', '살고', '있습니다', '위치', '주소', '예약', '지역']
-                if any(keyword in context for keyword in address_keywords):
-                    all_addresses.append({
-                        "province": province,
-                        "value": clean_match,
-                        "original_match": full_match,
-                        "start": match.start(),
-                        "end": match.end(),
-                        "confidence": 0.80,
-                        "priority": 2,
-                        "has_particle": full_match != clean_match,
-                        "is_complex": False
-                    })
+        context_hits = None  # 문맥 키워드 위치는 텍스트당 한 번만 계산
+        last_end = {}
+        for pos, province_index, province in province_hits:
+            if pos < last_end.get(province_index, 0):
+                continue
+            match = ADDRESS_SINGLE_TAIL_RX.match(text, pos + len(province))
+            last_end[province_index] = match.end()
+            full_match = text[pos:match.end()]
+            clean_match = ADDRESS_PARTICLE_RX.sub('', full_match).strip()
+            
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("단일 패턴: '%s' → 정리: '%s'", full_match, clean_match)
+            
+            # 앞뒤 15자 범위 안에 주소 문맥 키워드가 있는지 확인
+            if context_hits is None:
+                context_hits = _find_keyword_hits(text, ADDRESS_CONTEXT_RX)
+            if _has_keyword_hit(context_hits, pos - 15, match.end() + 15):
+                all_addresses.append(_AddressCandidate(
+                    province=province,
+                    value=clean_match,
+                    original_match=full_match,
+                    start=pos,
+                    end=match.end(),
+                    confidence=0.80,
+                    priority=2,
+                    has_particle=full_match != clean_match,
+                    is_complex=False
+                ))
     
     # 3. ⭐ 주소 중복 제거 및 우선순위 처리
-    all_addresses.sort(key=lambda x: (x["priority"], x["start"]))
+    all_addresses.sort(key=lambda x: (x.priority, x.start))
     
     # 복합 주소가 있으면 그 구성요소인 단일 주소들 제외
-    complex_addresses = [addr for addr in all_addresses if addr.get("is_complex", False)]
+    complex_addresses = [addr for addr in all_addresses if addr.is_complex]
     if complex_addresses:
-        print(f"  🔍 복합 주소 발견: {len(complex_addresses)}개 - 구성요소 제외 처리")
+        log.debug("🔍 복합 주소 발견: %s개 - 구성요소 제외 처리", len(complex_addresses))
         
         # 복합 주소만 사용
         for addr in complex_addresses:
             items.append({
                 "type": "주소",
-                "value": addr["value"],  # 정리된 주소
-                "start": addr["start"],
-                "end": addr["end"],
-                "confidence": addr["confidence"],
+                "value": addr.value,  # 정리된 주소
+                "start": addr.start,
+                "end": addr.end,
+                "confidence": addr.confidence,
                 "source": "normalizers-주소-복합",
-                "original_match": addr["original_match"],
-                "has_particle": addr["has_particle"]
+                "original_match": addr.original_match,
+                "has_particle": addr.has_particle
             })
-            print(f"  ✅ 복합 주소: '{addr['value']}' (원본: '{addr['original_match']}')")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 복합 주소: '%s' (원본: '%s')", addr.value, addr.original_match)
     else:
-        print(f"  🔍 복합 주소 없음 - 개별 주소 사용")
+        log.debug("🔍 복합 주소 없음 - 개별 주소 사용")
         # 복합 주소가 없을 때만 개별 주소 사용
         for addr in all_addresses:
             items.append({
                 "type": "주소",
-                "value": addr["value"],  # 정리된 주소
-                "start": addr["start"],
-                "end": addr["end"],
-                "confidence": addr["confidence"],
+                "value": addr.value,  # 정리된 주소
+                "start": addr.start,
+                "end": addr.end,
+                "confidence": addr.confidence,
                 "source": "normalizers-주소-개별",
-                "original_match": addr["original_match"],
-                "has_particle": addr["has_particle"]
+                "original_match": addr.original_match,
+                "has_particle": addr.has_particle
             })
-            print(f"  ✅ 개별 주소: '{addr['value']}' (원본: '{addr['original_match']}')")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 개별 주소: '%s' (원본: '%s')", addr.value, addr.original_match)
     
-    print(f"🏠 강화된 주소 탐지 완료: {len(items)}개")
+    log.debug("🏠 강화된 주소 탐지 완료: %s개", len(items))
     return items
 
-def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """NER 모델 보완 탐지 (중복 제거 강화, 전화번호 정규화)"""
+def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]],
+                               ner_entities: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """NER 모델 보완 탐지 (중복 제거 강화, 전화번호 정규화)
+
+    ner_entities가 주어지면 (일괄 처리에서 미리 추출한 결과) 모델을 다시 실행하지 않음
+    """
     if not NER_AVAILABLE:
         return []
     
@@ -540,9 +729,10 @@ def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]])
             elif item["type"] == "전화번호":
                 existing_values.add(item["value"])
                 # item에서 normalized 값을 가져오거나 직접 정규화
-                normalized_phone = item.get("normalized") or re.sub(r'[^0-9]', '', item["value"])
+                normalized_phone = item.get("normalized") or NON_DIGIT_RX.sub('', item["value"])
                 existing_normalized_phones.add(normalized_phone)
-                print(f"  ⭐ 기존 전화번호 정규화: '{item['value']}' → '{normalized_phone}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("⭐ 기존 전화번호 정규화: '%s' → '%s'", item['value'], normalized_phone)
             else:
                 existing_values.add(item["value"])
                 
@@ -555,15 +745,17 @@ def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]])
         # ⭐ 복합 주소가 있으면 그 구성요소들도 제외
         all_existing_values = existing_values.union(existing_complex_addresses)
         
-        print(f"🔍 NER 보완: 기존 값들 제외 - {len(all_existing_values)}개")
-        for val in sorted(all_existing_values):
-            print(f"  제외: '{val}'")
-        
-        print(f"🔍 NER 보완: 정규화된 전화번호 제외 - {len(existing_normalized_phones)}개")
-        for phone in sorted(existing_normalized_phones):
-            print(f"  정규화 제외: '{phone}'")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔍 NER 보완: 기존 값들 제외 - %s개", len(all_existing_values))
+            for val in sorted(all_existing_values):
+                log.debug("제외: '%s'", val)
+            
+            log.debug("🔍 NER 보완: 정규화된 전화번호 제외 - %s개", len(existing_normalized_phones))
+            for phone in sorted(existing_normalized_phones):
+                log.debug("정규화 제외: '%s'", phone)
         
-        ner_entities = extract_entities_with_ner(text)
+        if ner_entities is None:
+            ner_entities = extract_entities_with_ner(text)
         
         supplementary_items = []
         for entity in ner_entities:
@@ -577,37 +769,43 @@ def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]])
             # ⭐ 전화번호 중복 체크 및 정규화 강화
             if entity_type == "전화번호":
                 # 숫자만 추출해서 정규화
-                normalized_ner_phone = re.sub(r'[^0-9]', '', clean_value)
+                normalized_ner_phone = NON_DIGIT_RX.sub('', clean_value)
                 if normalized_ner_phone in existing_normalized_phones:
-                    print(f"    NER 제외: '{clean_value}' (정규화된 전화번호 중복: '{normalized_ner_phone}')")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("NER 제외: '%s' (정규화된 전화번호 중복: '%s')", clean_value, normalized_ner_phone)
                     continue
                 else:
                     # ⭐ NER 전화번호도 포맷팅된 형태로 저장
                     if len(normalized_ner_phone) == 11 and normalized_ner_phone.startswith('010'):
                         formatted_ner_phone = f"{normalized_ner_phone[:3]}-{normalized_ner_phone[3:7]}-{normalized_ner_phone[7:]}"
                         clean_value = formatted_ner_phone
-                        print(f"    ⭐ NER 전화번호 포맷팅: '{raw_value}' → '{formatted_ner_phone}' (정규화: '{normalized_ner_phone}')")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("⭐ NER 전화번호 포맷팅: '%s' → '%s' (정규화: '%s')", raw_value, formatted_ner_phone, normalized_ner_phone)
                     else:
-                        print(f"    ⭐ NER 전화번호 정규화: '{clean_value}' → '{normalized_ner_phone}'")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("⭐ NER 전화번호 정규화: '%s' → '%s'", clean_value, normalized_ner_phone)
             
             # ⭐ 강화된 중복 체크 (기존 로직)
             if clean_value in all_existing_values or not clean_value:
-                print(f"    NER 제외: '{clean_value}' (기존 항목과 중복)")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("NER 제외: '%s' (기존 항목과 중복)", clean_value)
                 continue
             
             if confidence > 0.9:
                 if entity_type == "이름":
                     if not is_valid_korean_name(clean_value, include_honorifics=True):
-                        print(f"    NER 제외: '{clean_value}' (유효하지 않은 이름)")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("NER 제외: '%s' (유효하지 않은 이름)", clean_value)
                         continue
-                    if not all('\uac00' <= char <= '\ud7af' or char in '씨님' for char in clean_value):
-                        print(f"    NER 제외: '{clean_value}' (한글이 아님)")
+                    if not HANGUL_ONLY_RX.fullmatch(clean_value):
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("NER 제외: '%s' (한글이 아님)", clean_value)
                         continue
                 
                 # 존칭 분리
                 base_name = clean_value
                 honorific = ""
-                if clean_value.endswith('님') or clean_value.endswith('씨'):
+                if clean_value.endswith(HONORIFICS):
                     base_name = clean_value[:-1]
                     honorific = clean_value[-1]
                 
@@ -626,35 +824,65 @@ def detect_with_ner_supplement(text: str, existing_items: List[Dict[str, Any]])
                 
                 # ⭐ 전화번호인 경우 normalized 값 추가
                 if entity_type == "전화번호":
-                    item_data["normalized"] = re.sub(r'[^0-9]', '', clean_value)
+                    item_data["normalized"] = NON_DIGIT_RX.sub('', clean_value)
                 
                 supplementary_items.append(item_data)
-                print(f"    ✅ NER 보완: '{clean_value}' ({entity_type})")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("✅ NER 보완: '%s' (%s)", clean_value, entity_type)
         
-        print(f"🔍 NER 보완 완료: {len(supplementary_items)}개 추가")
+        log.debug("🔍 NER 보완 완료: %s개 추가", len(supplementary_items))
         return supplementary_items
         
     except Exception as e:
-        print(f"NER 보완 탐지 오류: {e}")
+        log.warning("NER 보완 탐지 오류: %s", e)
         return []
 
-async def detect_pii_all(text: str) -> List[Dict[str, Any]]:
-    """통합 PII 탐지 함수 (이름/주소 강화, 조사 제외)"""
-    print(f"\n🔍 === 강화된 PII 탐지 시작 (이름/주소 강화, 조사 제외) ===")
-    print(f"📝 입력: '{text}'")
+def _dedupe_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    """중복 체크 키 (이름의 경우 기본 이름 기준)"""
+    if item["type"] == "이름":
+        return (item["type"], item.get("base_name", item["value"]))
+    return (item["type"], item["value"])
+
+def has_pii_candidate(text: str) -> bool:
+    """PII가 있을 수 있는 문자(숫자/'@'/한글)가 하나라도 있는지 확인 (첫 문자에서 바로 종료)"""
+    return PII_CANDIDATE_RX.search(text) is not None
+
+async def detect_pii_all(text: str, ner_entities: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """통합 PII 탐지 함수 (이름/주소 강화, 조사 제외)
+
+    ner_entities: 미리 추출한 NER 결과 (일괄 처리용, 없으면 여기서 NER 실행)
+    """
+    log.debug("🔍 === 강화된 PII 탐지 시작 (이름/주소 강화, 조사 제외) ===")
+    log.debug("📝 입력: '%s'", text)
+    
+    # ⭐ 후보 문자가 없는 텍스트는 정규식/NER 모두 생략
+    if not has_pii_candidate(text):
+        log.debug("⚡ PII 후보 문자 없음 - 탐지 생략")
+        return []
     
     all_items = []
     
+    # ⭐ 미리 추출한 NER 결과가 없으면 NER 추론만 스레드에서 먼저 시작 (정규식 탐지와 함께 진행, 지연 시간 = 가장 느린 쪽)
+    use_ner = NER_AVAILABLE and is_ner_available()  # 모델 로드가 실패했으면 NER 단계 생략
+    ner_task = None
+    if use_ner and ner_entities is None:
+        ner_task = asyncio.ensure_future(asyncio.to_thread(extract_entities_with_ner, text))
+    
     # 1단계: normalizers 기반 주요 탐지 
-    all_items.extend(detect_emails(text))
-    all_items.extend(detect_phones(text))
-    all_items.extend(detect_names(text))      # ⭐ 조사 제외 강화됨
-    all_items.extend(detect_addresses(text))  # ⭐ 중복 제거 강화됨
-    all_items.extend(detect_ages(text))
+    email_items, phone_items, age_items = detect_primary_pii(text)  # ⭐ 한 번의 스캔
+    name_items = detect_names(text)                                 # ⭐ 조사 제외 강화됨
+    address_items = detect_addresses(text)                          # ⭐ 중복 제거 강화됨
+    if ner_task is not None:
+        ner_entities = await ner_task
+    all_items.extend(email_items)
+    all_items.extend(phone_items)
+    all_items.extend(name_items)
+    all_items.extend(address_items)
+    all_items.extend(age_items)
     
     # 2단계: NER 보완 (중복 제거 강화)
-    if NER_AVAILABLE:
-        ner_supplement = detect_with_ner_supplement(text, all_items)
+    if use_ner:
+        ner_supplement = detect_with_ner_supplement(text, all_items, ner_entities)
         all_items.extend(ner_supplement)
     
     # 3단계: ⭐ 최종 중복 제거 (개선됨)
@@ -662,21 +890,19 @@ async def detect_pii_all(text: str) -> List[Dict[str, Any]]:
     final_items = []
     
     for item in all_items:
-        # 이름의 경우 기본 이름으로 중복 체크
-        if item["type"] == "이름":
-            base_name = item.get("base_name", item["value"])
-            key = (item["type"], base_name)
-        else:
-            key = (item["type"], item["value"])
-        
+        key = _dedupe_key(item)
         if key not in seen_items:
+            # ⭐ 탐지 값 intern (대체 맵 키 등에서 같은 문자열 객체 공유)
+            item["value"] = sys.intern(item["value"])
             final_items.append(item)
             seen_items.add(key)
-            print(f"✅ 최종 항목: {item['type']} '{item['value']}' (출처: {item.get('source', 'unknown')})")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ 최종 항목: %s '%s' (출처: %s)", item['type'], item['value'], item.get('source', 'unknown'))
         else:
-            print(f"🔄 중복 제거: {item['type']} '{item['value']}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🔄 중복 제거: %s '%s'", item['type'], item['value'])
     
-    print(f"🔍 === 강화된 PII 탐지 완료 (이름/주소 강화, 조사 제외): {len(final_items)}개 ===\n")
+    log.debug("🔍 === 강화된 PII 탐지 완료 (이름/주소 강화, 조사 제외): %s개 ===", len(final_items))
     return final_items
 
 # ===== 기존 정규화 함수들 (유지) =====
@@ -753,7 +979,7 @@ def norm_address(val: Optional[str]) -> Optional[str]:
         return None
     cleaned = re.sub(r"\s+", " ", val).strip()
     # 끝의 조사만 제거
-    cleaned = re.sub(r'(에서|에|로|으로)$', '', cleaned).strip()
+    cleaned = ADDRESS_PARTICLE_RX.sub('', cleaned).strip()
     return cleaned
 
 def cross_check(entity: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
@@ -770,7 +996,8 @@ def cross_check(entity: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
                 found_email = match.group().strip().lower()
                 entity["email"] = found_email
                 entity["address"] = None
-                print(f"📧 교차검증: 주소에서 이메일 추출 '{found_email}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("📧 교차검증: 주소에서 이메일 추출 '%s'", found_email)
                 break
         else:
             # 패턴 매칭 실패 시 주소 필드 제거
@@ -779,14 +1006,53 @@ def cross_check(entity: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
     return entity
 
 # 호환성 함수들
+# 동기 호출용 백그라운드 이벤트 루프 (호출마다 루프를 새로 만들지 않음)
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_thread: Optional[threading.Thread] = None
+_sync_loop_lock = threading.Lock()
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """데몬 스레드에서 도는 공용 이벤트 루프 반환 (최초 호출 시 시작)"""
+    global _sync_loop, _sync_loop_thread
+    if _sync_loop is None:
+        with _sync_loop_lock:
+            if _sync_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="pseudonymization-loop", daemon=True)
+                thread.start()
+                _sync_loop_thread = thread
+                _sync_loop = loop
+    return _sync_loop
+
+def _reset_sync_loop_in_child():
+    """fork된 자식 프로세스에서 공용 루프 초기화 (루프 스레드는 자식에 남지 않으므로 다음 호출 시 새로 시작)"""
+    global _sync_loop, _sync_loop_thread, _sync_loop_lock
+    _sync_loop = None
+    _sync_loop_thread = None
+    _sync_loop_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sync_loop_in_child)
+
+def run_sync(coro):
+    """코루틴을 공용 이벤트 루프에서 실행하고 결과 반환 (동기 코드용)
+
+    공용 루프 스레드 안(그 루프에서 도는 코루틴)에서 호출하면 자기 자신을 기다리며 멈추므로 예외 발생.
+    """
+    loop = _get_sync_loop()
+    if threading.current_thread() is _sync_loop_thread:
+        coro.close()
+        raise RuntimeError("run_sync()는 공용 이벤트 루프 스레드 안에서 호출할 수 없습니다 (await 사용)")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
 def detect_pii_enhanced(text: str):
-    return asyncio.run(detect_pii_all(text))
+    return run_sync(detect_pii_all(text))
 
 def detect_with_ner(text: str):
-    return asyncio.run(detect_pii_all(text))
+    return run_sync(detect_pii_all(text))
 
 def detect_with_regex(text: str):
-    return asyncio.run(detect_pii_all(text))
+    return run_sync(detect_pii_all(text))
 
 def detect_names_from_csv(text: str):
     return detect_names(text)
@@ -795,21 +1061,11 @@ def detect_addresses_from_csv(text: str):
     return detect_addresses(text)
 
 def merge_detections(*detection_lists):
-    merged = []
-    for detection_list in detection_lists:
-        if detection_list:
-            merged.extend(detection_list)
-    
     seen = set()
     unique = []
-    for item in merged:
-        # 이름의 경우 기본 이름으로 중복 체크
-        if item.get("type") == "이름":
-            base_name = item.get("base_name", item["value"])
-            key = (item["type"], base_name)
-        else:
-            key = (item["type"], item["value"])
-        
+    # 목록을 합친 복사본을 만들지 않고 순서대로 순회
+    for item in chain.from_iterable(filter(None, detection_lists)):
+        key = _dedupe_key(item)
         if key not in seen:
             unique.append(item)
             seen.add(key)
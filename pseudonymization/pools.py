@@ -1,7 +1,12 @@
 # pseudonymization/pools.py - 모듈화된 데이터풀 (import 오류 수정)
 import random
+import itertools
+import threading
 from typing import List, Set, Dict, Any
 
+# 데이터풀 버전 발급기 (탐지기 캐시 무효화용)
+_version_counter = itertools.count(1)
+
 class DataPools:
     """데이터풀 관리 클래스"""
     
@@ -88,6 +93,13 @@ class DataPools:
         self.phone_counter = 0
         self.email_counter = 0
         self.address_counter = 0
+        
+        # 데이터 버전 (탐지기 캐시는 이 값이 바뀔 때만 재구성)
+        self._version = next(_version_counter)
+    
+    def mark_updated(self):
+        """데이터 목록을 직접 수정한 뒤 호출 - 탐지기 캐시 재구성"""
+        self._version = next(_version_counter)
     
     def _get_hardcoded_address_data(self) -> Dict[str, List[str]]:
         """하드코딩된 주소 데이터 반환 (김포 및 새로운 지역 추가)"""
@@ -185,12 +197,15 @@ class DataPools:
 
 # 전역 인스턴스
 _data_pools = None
+_data_pools_lock = threading.Lock()
 
 def get_pools() -> DataPools:
-    """데이터풀 인스턴스 반환"""
+    """데이터풀 인스턴스 반환 (이중 검사 잠금 - 최초 동시 호출에서 한 번만 생성)"""
     global _data_pools
     if _data_pools is None:
-        _data_pools = DataPools()
+        with _data_pools_lock:
+            if _data_pools is None:
+                _data_pools = DataPools()
     return _data_pools
 
 def initialize_pools():
@@ -203,21 +218,33 @@ def reload_pools():
     """데이터풀 재로드"""
     initialize_pools()
 
+# 데이터풀 크기 통계 캐시 (데이터풀 버전이 바뀔 때만 다시 계산)
+_pool_size_cache: Dict[str, Any] = {"version": None, "sizes": None}
+
+def _get_pool_sizes(pools: DataPools) -> Dict[str, Any]:
+    """데이터풀 크기 통계 (버전별 캐시)"""
+    if _pool_size_cache["version"] != pools._version:
+        sizes = {
+            "real_names": len(pools.real_names),
+            "fake_names": len(pools.fake_names),
+            "fake_emails": len(pools.fake_emails),
+            "fake_addresses": len(pools.fake_addresses),
+            "exclude_words": len(pools.name_exclude_words),
+            "provinces": len(pools.provinces),
+            "cities": len(pools.cities),
+            "roads": len(pools.roads) if hasattr(pools, 'roads') else 0,
+            "districts": len(pools.districts),
+            "address_data_loaded": True
+        }
+        _pool_size_cache.update(version=pools._version, sizes=sizes)
+    return _pool_size_cache["sizes"]
+
 def get_data_pool_stats() -> Dict[str, Any]:
-    """데이터풀 통계 반환"""
+    """데이터풀 통계 반환 (크기는 캐시, 카운터는 매번 조회)"""
     pools = get_pools()
     
     return {
-        "real_names": len(pools.real_names),
-        "fake_names": len(pools.fake_names),
-        "fake_emails": len(pools.fake_emails),
-        "fake_addresses": len(pools.fake_addresses),
-        "exclude_words": len(pools.name_exclude_words),
-        "provinces": len(pools.provinces),
-        "cities": len(pools.cities),
-        "roads": len(pools.roads) if hasattr(pools, 'roads') else 0,
-        "districts": len(pools.districts),
-        "address_data_loaded": True,
+        **_get_pool_sizes(pools),
         "counters": {
             "name_counter": pools.name_counter,
             "phone_counter": pools.phone_counter,
@@ -10,6 +10,13 @@ import re
 from typing import Dict, List, Any, Tuple
 from .pools import get_pools
 
+# 원본 그대로 유지하는 광역시/도 이름
+METROPOLITAN_CITIES = frozenset({"서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종"})
+PROVINCE_NAMES = frozenset({"경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"})
+
+# 가명 주소에서 떼어내는 접미사
+ADDRESS_SUFFIXES = ("시", "도")
+
 class ReplacementManager:
     """기본 치환 매니저 (토큰 기반)"""
     
@@ -222,15 +229,15 @@ class WorkflowReplacementManager:
         """주소별 적절한 가명 주소 생성"""
         
         # 원본 주소 그대로 반환
-        if original in ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종"]:
+        if original in METROPOLITAN_CITIES:
             return original
-        elif original in ["경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]:
+        elif original in PROVINCE_NAMES:
             return original
         else:
             # 기타 지역은 순환하는 가명 주소 사용
             fake_address = self.pools.fake_addresses[self.counters["주소"] % len(self.pools.fake_addresses)]
             # 접미사 제거
-            for suffix in ["시", "도"]:
+            for suffix in ADDRESS_SUFFIXES:
                 if fake_address.endswith(suffix):
                     return fake_address[:-len(suffix)]
             return fake_address
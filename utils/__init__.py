@@ -11,6 +11,10 @@ from .logging import (
     get_log_stats,
     clear_logs,
     backup_logs,
+    LogStore,
+    dumps_json,
+    loads_json,
+    setup_queue_logging,
     append_log_entry,  # 호환성
     read_logs         # 호환성
 )
@@ -21,6 +25,10 @@ __all__ = [
     'get_log_stats',
     'clear_logs',
     'backup_logs',
+    'LogStore',
+    'dumps_json',
+    'loads_json',
+    'setup_queue_logging',
     'append_log_entry',
     'read_logs'
 ]
\ No newline at end of file
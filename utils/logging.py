@@ -5,10 +5,50 @@
 
 import os
 import json
+import time
+import queue
+import atexit
 import shutil
+import logging
+import tempfile
+import contextlib
+import threading
+import logging.handlers
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+# orjson (선택적 - 설치되어 있으면 JSON 직렬화에 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# fcntl (선택적 - POSIX에서 여러 프로세스의 로그 파일 기록을 파일 잠금으로 직렬화)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트, indent=True면 들여쓰기 2칸) - orjson 우선, 없으면 json"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # orjson이 처리하지 못하는 타입은 json으로
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 - orjson 우선, 없으면 json"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def append_json_to_file(path: str, new_entry: Dict[str, Any]) -> None:
     """JSON 엔트리를 로그 파일에 추가"""
     try:
@@ -32,8 +72,8 @@ def load_logs_from_file(path: str) -> Dict[str, List]:
     """로그 파일에서 데이터 로드"""
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return loads_json(f.read())
         return {"logs": []}
     except Exception as e:
         print(f"로그 로드 실패: {e}")
@@ -97,6 +137,219 @@ def backup_logs(path: str, backup_dir: str = "backups") -> Optional[str]:
         print(f"로그 백업 실패: {e}")
         return None
 
+class LogStore:
+    """메모리 로그 저장소 + 백그라운드 파일 기록기
+
+    로그는 메모리에서 바로 추가/조회하고, 파일은 별도 스레드가 모아서 기록
+    (요청 처리 중에는 파일 입출력이 일어나지 않음). 파일 형식은 기존과 같은
+    {"logs": [...]} 전체 JSON.
+
+    여러 워커 프로세스가 같은 파일을 쓰는 경우 (gunicorn 등):
+    - 기록할 때 파일을 다시 읽어 다른 프로세스의 로그와 합친 뒤 저장 (fcntl이 있으면 파일 잠금)
+    - lookup()은 메모리에 없는 request_id면 파일을 다시 읽어서 찾음
+    - 다른 프로세스의 로그는 그 프로세스가 기록한 뒤(flush_interval 이내)부터 보임
+    """
+    
+    def __init__(self, path: str, max_logs: int = 100, flush_interval: float = 0.1):
+        self.path = path
+        self.max_logs = max_logs
+        self.flush_interval = flush_interval  # 변경 사항을 모아서 기록하는 간격 (초)
+        
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._write_lock = threading.Lock()
+        
+        self._logs: List[Dict[str, Any]] = self._read_file_logs()
+        self._pending: List[Dict[str, Any]] = []  # 아직 파일에 기록하지 않은 이 프로세스의 로그
+        self._cleared = False  # clear() 이후 아직 파일에 반영하지 않음
+        
+        self._start_writer()
+        atexit.register(self._flush_on_exit)  # 종료 직전 아직 기록되지 않은 로그 저장
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reinit_after_fork)  # gunicorn --preload 워커 등
+    
+    def _start_writer(self) -> None:
+        """백그라운드 파일 기록 스레드 시작"""
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+    
+    def _reinit_after_fork(self) -> None:
+        """fork된 자식 프로세스에서 잠금/이벤트/기록 스레드 다시 생성
+
+        스레드는 fork 후 자식에 남지 않고, 부모 스레드가 잡고 있던 잠금은 풀리지 않은 채 복사될 수 있음.
+        부모의 미기록 로그는 부모가 기록하므로 자식에서는 버림 (두 번 기록되지 않도록).
+        """
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._pending = []
+        self._cleared = False
+        self._start_writer()
+    
+    def _read_file_logs(self) -> List[Dict[str, Any]]:
+        """파일의 로그 목록 (최근 max_logs개)"""
+        logs = load_logs_from_file(self.path).get("logs", [])
+        return logs[-self.max_logs:] if isinstance(logs, list) else []
+    
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """프로세스 간 파일 잠금 (읽기-병합-쓰기 구간, fcntl이 없으면 잠금 없음)"""
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """로그 추가 (파일 기록은 백그라운드에서)"""
+        with self._lock:
+            self._logs.append(entry)
+            if len(self._logs) > self.max_logs:
+                del self._logs[:-self.max_logs]
+            self._pending.append(entry)
+            if len(self._pending) > self.max_logs:
+                del self._pending[:-self.max_logs]
+        self._dirty.set()
+    
+    def snapshot(self, refresh: bool = False) -> Dict[str, List]:
+        """현재 로그 복사본 반환 ({"logs": [...]} 형식, refresh=True면 파일을 다시 읽어 다른 프로세스 로그 반영)"""
+        if refresh:
+            self._refresh_from_file()
+        with self._lock:
+            return {"logs": list(self._logs)}
+    
+    def lookup(self, request_id: str) -> Dict[str, List]:
+        """request_id 조회용 로그 복사본 (메모리에 없으면 다른 프로세스가 기록했을 수 있으므로 파일에서 다시 읽음)"""
+        data = self.snapshot()
+        if any(entry.get("request_id") == request_id for entry in data["logs"]):
+            return data
+        return self.snapshot(refresh=True)
+    
+    def clear(self) -> None:
+        """로그 전체 삭제"""
+        with self._lock:
+            self._logs.clear()
+            self._pending.clear()
+            self._cleared = True
+        self._dirty.set()
+    
+    def _refresh_from_file(self) -> None:
+        """파일 내용 + 아직 기록하지 않은 로그로 메모리 로그 교체"""
+        with self._write_lock:
+            logs = self._read_file_logs()
+            with self._lock:
+                if self._cleared:
+                    return  # 파일은 삭제 전 내용이므로 반영하지 않음
+                self._logs = (logs + self._pending)[-self.max_logs:]
+    
+    def flush(self) -> None:
+        """미기록 로그를 파일 내용과 합쳐 즉시 기록 (프로세스별 임시 파일에 쓴 뒤 교체)"""
+        self._dirty.clear()
+        with self._write_lock, self._file_lock():
+            with self._lock:
+                pending, self._pending = self._pending, []
+                cleared, self._cleared = self._cleared, False
+            try:
+                logs = [] if cleared else self._read_file_logs()
+                logs.extend(pending)
+                del logs[:-self.max_logs]
+                self._write_file({"logs": logs})
+            except Exception:
+                with self._lock:  # 다음 기록에서 다시 시도
+                    self._pending[:0] = pending
+                    self._cleared = self._cleared or cleared
+                raise
+            with self._lock:
+                self._logs = (logs + self._pending)[-self.max_logs:]
+    
+    def _write_file(self, data: Dict[str, List]) -> None:
+        """같은 디렉토리의 고유 임시 파일에 쓴 뒤 원자적으로 교체 (프로세스끼리 임시 파일을 공유하지 않음)"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(self.path)}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps_json(data))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _flush_on_exit(self) -> None:
+        """프로세스 종료 시 남은 변경 사항 기록 (데몬 기록 스레드는 종료 시 중단되므로)"""
+        if self._dirty.is_set():
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"로그 저장 실패: {e}")
+    
+    def _writer_loop(self) -> None:
+        """변경 신호를 기다렸다가 잠시 모은 뒤 한 번에 기록"""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.flush_interval)  # 연속 요청을 한 번의 기록으로 합침
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"로그 저장 실패: {e}")
+
+# 큐 기반 로깅 (요청 스레드는 큐에 넣기만 하고 출력은 리스너 스레드가 담당)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener_lock = threading.Lock()
+
+def _start_queue_listener(handlers) -> logging.handlers.QueueListener:
+    """새 큐를 만들어 QueueHandler에 연결하고 리스너 스레드 시작"""
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _queue_handler.queue = log_queue
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def _stop_queue_listener() -> None:
+    """종료 시 남은 로그 출력 (현재 프로세스의 리스너)"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+def _restart_queue_listener_in_child() -> None:
+    """fork된 자식 프로세스에서 리스너 다시 시작
+
+    스레드는 fork 후 자식에 남지 않으므로 그대로 두면 QueueHandler가 넣은 로그가 출력되지 않고
+    큐에 계속 쌓임. 부모 스레드가 잡고 있던 잠금이 남아 있을 수 있어 큐/잠금도 새로 만듦.
+    """
+    global _queue_listener, _queue_listener_lock
+    _queue_listener_lock = threading.Lock()
+    if _queue_listener is not None:
+        _queue_listener = _start_queue_listener(_queue_listener.handlers)
+
+def setup_queue_logging(level: int = logging.INFO,
+                        fmt: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s") -> logging.handlers.QueueListener:
+    """루트 로거에 QueueHandler 설치 후 QueueListener(StreamHandler) 시작 (여러 번 호출해도 한 번만 설정)"""
+    global _queue_listener, _queue_handler
+    with _queue_listener_lock:
+        if _queue_listener is not None:
+            return _queue_listener
+        
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(fmt))
+        
+        _queue_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+        
+        _queue_listener = _start_queue_listener((stream_handler,))
+        atexit.register(_stop_queue_listener)  # 종료 시 남은 로그 출력
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_restart_queue_listener_in_child)  # gunicorn --preload 워커 등
+        return _queue_listener
+
 # 호환성 함수들
 def append_log_entry(path: str, entry: Dict[str, Any]) -> None:
     """로그 엔트리 추가 (호환성)"""